@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Instrumentation Overhead Benchmark
+Measures what TempConverter instrumentation costs while disabled and enabled.
+
+Disabled and never-enabled are the same state (temp_converter._probe is None),
+so the disabled cost is the guard each conversion method runs. The benchmark
+times that guard on its own and compares it with the round-to-round noise of
+two identical disabled series. Modes are timed in interleaved rounds, in a
+rotating order, and each is reported as the median change against the
+disabled timing of the same round, so slow periods on a busy machine cancel
+out instead of landing on whichever mode happened to run then.
+"""
+
+import argparse
+import statistics
+import timeit
+import types
+import converter_instrumentation
+import temp_converter
+from temp_converter import TempConverter
+
+
+def _guard():
+    probe = _probe
+    if probe is not None:
+        pass
+
+
+def _bare():
+    pass
+
+
+# The check every conversion method runs while instrumentation is disabled,
+# compiled against temp_converter's globals so _probe is the same one global
+# lookup convert() does; bare is the same call without the check
+guard = types.FunctionType(_guard.__code__, vars(temp_converter))
+bare = types.FunctionType(_bare.__code__, vars(temp_converter))
+
+
+def interleaved(timers, modes, number, rounds):
+    """
+    Time every (mode, statement) pair round-robin
+
+    Args:
+        timers (dict): name -> timeit.Timer
+        modes (dict): mode name -> callable that switches instrumentation
+        number (int): Calls per timing
+        rounds (int): Rounds; the mode order rotates every round
+
+    Returns:
+        dict: (mode, name) -> nanoseconds per call, one entry per round
+    """
+    times = {}
+    order = list(modes)
+    for round_number in range(rounds):
+        shift = round_number % len(order)
+        for mode in order[shift:] + order[:shift]:
+            modes[mode]()
+            for name, timer in timers.items():
+                times.setdefault((mode, name), []).append(timer.timeit(number) / number * 1e9)
+    converter_instrumentation.disable()
+    return times
+
+
+def change(times, mode, name, base="disabled"):
+    """Median per-round change of mode against base, in percent"""
+    return (statistics.median(t / b for t, b in zip(times[(mode, name)], times[(base, name)])) - 1) * 100
+
+
+def main(argv=None):
+    """Run the overhead benchmark"""
+    parser = argparse.ArgumentParser(description="Measure TempConverter instrumentation overhead.")
+    parser.add_argument("--number", type=int, default=2000, help="Scalar calls per timing")
+    parser.add_argument("--rounds", type=int, default=300, help="Interleaved rounds (medians are reported)")
+    args = parser.parse_args(argv)
+
+    batch = list(range(1000))
+    timers = {
+        "scalar": timeit.Timer("convert(25.0, 'C', 'F')", globals={"convert": TempConverter.convert}),
+        "batch": timeit.Timer("convert_batch(batch, 'C', 'F')",
+                              globals={"convert_batch": TempConverter.convert_batch, "batch": batch}),
+    }
+    modes = {
+        "disabled": converter_instrumentation.disable,
+        "disabled (repeat)": converter_instrumentation.disable,
+        "enabled, sample 1/64": lambda: converter_instrumentation.enable(sample_every=64),
+        "enabled, sample 1/16": lambda: converter_instrumentation.enable(sample_every=16),
+        "enabled, every call": lambda: converter_instrumentation.enable(sample_every=1),
+    }
+
+    print("⏱️  TempConverter instrumentation overhead")
+    print("=" * 60)
+    scalar = interleaved({"scalar": timers["scalar"]}, modes, args.number, args.rounds)
+    batch_times = interleaved({"batch": timers["batch"]}, modes, max(1, args.number // 100), args.rounds // 10 or 1)
+    guard_times = interleaved({"guard": timeit.Timer(guard), "bare": timeit.Timer(bare)},
+                              {"disabled": converter_instrumentation.disable}, args.number * 10, args.rounds)
+
+    print(f"{'mode':<24}{'scalar ns/call':>16}{'batch us/1000':>16}")
+    for mode in modes:
+        print(f"{mode:<24}{statistics.median(scalar[(mode, 'scalar')]):16.1f}"
+              f"{statistics.median(batch_times[(mode, 'batch')]) / 1000:16.2f}")
+    print("-" * 60)
+
+    base = statistics.median(scalar[("disabled", "scalar")])
+    # Typical size of one round's difference between two identical series
+    noise = statistics.median(abs(t / b - 1) for t, b in zip(scalar[("disabled (repeat)", "scalar")],
+                                                             scalar[("disabled", "scalar")])) * 100
+    guard_ns = statistics.median(guard_times[("disabled", "guard")]) - statistics.median(guard_times[("disabled", "bare")])
+    guard_pct = guard_ns / base * 100
+    verdict = "within" if abs(guard_pct) <= noise else "above"
+    print(f"Disabled guard:               {guard_ns:+.1f} ns/call ({guard_pct:+.2f}% of convert)")
+    print(f"Noise (disabled vs repeat):   ±{noise:.2f}% per round  -> guard is {verdict} run-to-run noise")
+    for mode in ("disabled (repeat)", "enabled, sample 1/64", "enabled, sample 1/16", "enabled, every call"):
+        print(f"Change, {mode + ':':<22}{change(scalar, mode, 'scalar'):+.1f}% scalar, "
+              f"{change(batch_times, mode, 'batch'):+.1f}% batch")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Spatial Cache Benchmark
+Fills a ReadingIndex with many cached readings and measures lookup latency
+and hit rate for vehicle-style queries near recent readings and for
+uniformly random queries.
+"""
+
+import argparse
+import random
+import time
+from spatial_cache import ReadingIndex
+
+
+# Roughly the continental United States
+BOUNDS = (25.0, 49.0, -124.0, -67.0)
+
+
+def random_point(rng):
+    south, north, west, east = BOUNDS
+    return rng.uniform(south, north), rng.uniform(west, east)
+
+
+def lookup_stats(index, queries):
+    """
+    Run queries and report latency and hit rate
+
+    Returns:
+        tuple: (hit rate, mean microseconds, p99 microseconds)
+    """
+    hits_before = index.hits
+    latencies = []
+    for lat, lon in queries:
+        start = time.perf_counter()
+        index.nearest(lat, lon)
+        latencies.append(time.perf_counter() - start)
+    latencies.sort()
+    hit_rate = (index.hits - hits_before) / len(queries)
+    mean = sum(latencies) / len(latencies) * 1e6
+    p99 = latencies[int(len(latencies) * 0.99)] * 1e6
+    return hit_rate, mean, p99
+
+
+def main(argv=None):
+    """Run the spatial cache benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark nearest-reading lookups.")
+    parser.add_argument("--points", type=int, default=100000, help="Cached readings (default: %(default)s)")
+    parser.add_argument("--queries", type=int, default=20000, help="Lookups per scenario")
+    parser.add_argument("--radius", type=float, default=5.0, help="Match radius in km")
+    parser.add_argument("--drift", type=float, default=3.0,
+                        help="Max distance in km between a vehicle query and a cached reading")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    index = ReadingIndex(radius_km=args.radius, max_entries=args.points)
+
+    points = [random_point(rng) for _ in range(args.points)]
+    start = time.perf_counter()
+    for i, (lat, lon) in enumerate(points):
+        index.insert(lat, lon, i)
+    insert_us = (time.perf_counter() - start) / args.points * 1e6
+
+    # Vehicles are a few km from somewhere we fetched moments ago
+    drift_deg = args.drift / 111.2 / 1.5
+    nearby = []
+    for lat, lon in rng.sample(points, min(args.queries, len(points))):
+        nearby.append((lat + rng.uniform(-drift_deg, drift_deg), lon + rng.uniform(-drift_deg, drift_deg)))
+    uniform = [random_point(rng) for _ in range(args.queries)]
+
+    print(f"🗺️  ReadingIndex: {len(index):,} cached readings, radius {args.radius} km")
+    print("=" * 64)
+    print(f"Insert: {insert_us:.2f} us/reading")
+    print(f"{'scenario':<22}{'hit rate':>10}{'mean us':>12}{'p99 us':>12}")
+    for label, queries in [("near recent readings", nearby), ("uniform random", uniform)]:
+        hit_rate, mean, p99 = lookup_stats(index, queries)
+        print(f"{label:<22}{hit_rate:>10.1%}{mean:>12.2f}{p99:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Multi-threaded Conversion Benchmark
+Measures TempConverter throughput as threads are added. On a free-threaded
+(no-GIL) build throughput should scale close to linearly with cores; on the
+standard build it stays flat, and should not drop. With --instrument the same
+runs go through converter_instrumentation, whose per-thread counters must
+neither serialize the threads nor lose counts.
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+from array import array
+import converter_instrumentation
+from temp_converter import TempConverter
+
+
+def gil_status():
+    """Describe whether the GIL is active in this interpreter"""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    if is_gil_enabled is None:
+        return "GIL enabled (standard build)"
+    return "GIL enabled" if is_gil_enabled() else "GIL disabled (free-threaded)"
+
+
+def run(threads, batches, batch_size, path):
+    """
+    Convert `batches` batches on each of `threads` threads
+
+    Returns:
+        float: Values converted per second across all threads
+    """
+    barrier = threading.Barrier(threads + 1)
+
+    def worker():
+        # Each thread owns its data; the converter itself holds no shared state
+        if path == "scalar":
+            def convert():
+                for value in range(batch_size):
+                    TempConverter.convert(value, 'C', 'F')
+        elif path == "buffer":
+            data = array('d', range(batch_size))
+            out = array('d', data)
+            convert = lambda: TempConverter.convert_buffer(data, 'C', 'F', out=out)
+        else:
+            data = list(range(batch_size))
+            convert = lambda: TempConverter.convert_batch(data, 'C', 'F')
+        barrier.wait()
+        for _ in range(batches):
+            convert()
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    for thread in workers:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    return threads * batches * batch_size / elapsed
+
+
+def main(argv=None):
+    """Run the scaling benchmark"""
+    parser = argparse.ArgumentParser(description="Measure TempConverter throughput across threads.")
+    parser.add_argument("--max-threads", type=int, default=os.cpu_count() or 1,
+                        help="Largest thread count to try (default: CPU count)")
+    parser.add_argument("--batches", type=int, default=200, help="Batches per thread")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Values per batch")
+    parser.add_argument("--path", choices=["scalar", "batch", "buffer"], default="batch",
+                        help="convert per value, convert_batch on lists, or convert_buffer on arrays")
+    parser.add_argument("--instrument", type=int, metavar="N",
+                        help="Enable instrumentation, sampling 1 call in N")
+    args = parser.parse_args(argv)
+    if args.instrument is not None and args.instrument < 1:
+        parser.error("--instrument must be at least 1")
+
+    instrumented = f", instrumented 1/{args.instrument}" if args.instrument else ""
+    print(f"🧵 TempConverter {args.path} throughput{instrumented}, "
+          f"Python {sys.version.split()[0]}, {gil_status()}")
+    print("=" * 60)
+    print(f"{'threads':>8}{'values/s':>18}{'speedup':>12}{'efficiency':>14}")
+
+    counts = [1]
+    while counts[-1] * 2 <= args.max_threads:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != args.max_threads:
+        counts.append(args.max_threads)
+
+    baseline = None
+    for threads in counts:
+        if args.instrument:
+            converter_instrumentation.enable(sample_every=args.instrument)
+            converter_instrumentation.reset()
+        try:
+            rate = run(threads, args.batches, args.batch_size, args.path)
+            stats = converter_instrumentation.snapshot()
+        finally:
+            converter_instrumentation.disable()
+        baseline = baseline or rate
+        speedup = rate / baseline
+        line = f"{threads:>8}{rate:>18,.0f}{speedup:>11.2f}x{speedup / threads:>13.0%}"
+        if stats:
+            # Scalar counts are estimates; batch and buffer counts are exact
+            expected = threads * args.batches * (args.batch_size if args.path == "scalar" else 1)
+            line += f"   counted {stats['paths'][args.path]['calls']:,} of {expected:,} calls"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Field Selection Benchmark
+Compares payload size and fetch+parse time for a temperature-only fetcher
+against one requesting every variable in all three units, using replayed
+responses so no network is involved.
+
+Usage:
+    python3 benchmark_weather_fields.py                        # synthetic payloads
+    python3 benchmark_weather_fields.py minimal.json full.json # recorded payloads
+
+Record the two fixtures with, for example:
+    python3 weather_transport.py minimal.json London Tokyo --fields temperature
+    python3 weather_transport.py full.json London Tokyo --fields temperature humidity wind_speed weather_code
+"""
+
+import argparse
+import time
+from benchmark_weather_replay import synthetic_fixture, fixture_locations
+from weather_fetcher import WeatherFetcher, CURRENT_FIELDS
+from weather_transport import ReplayTransport, load_fixture
+
+
+PROFILES = {
+    "minimal": {"fields": ("temperature",), "units": ('C',)},
+    "full": {"fields": tuple(CURRENT_FIELDS), "units": ('C', 'F', 'K')},
+}
+
+
+def measure(responses, profile, rounds):
+    """
+    Replay every recorded forecast with the given profile
+
+    Returns:
+        tuple: (mean forecast payload bytes, microseconds per fetch)
+    """
+    fetcher = WeatherFetcher(transport=ReplayTransport(responses), **PROFILES[profile])
+    forecasts = [body for url, body in responses.items() if "/forecast?" in url]
+    # geocode() has no IP/default fallback, so a fixture that lacks a name fails loudly
+    cities = [fetcher.geocode(name) for name in fixture_locations(responses)]
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for coords in cities:
+            fetcher.get_temperature_at(coords)
+    elapsed = time.perf_counter() - start
+
+    payload = sum(len(body.encode()) for body in forecasts) / len(forecasts)
+    return payload, elapsed / (rounds * len(cities)) * 1e6
+
+
+def main(argv=None):
+    """Run the field selection benchmark"""
+    parser = argparse.ArgumentParser(description="Compare minimal and full weather field sets.")
+    parser.add_argument("fixtures", nargs="*",
+                        help="Recorded minimal and full fixtures (synthetic if omitted)")
+    parser.add_argument("--cities", type=int, default=200, help="Synthetic cities (default: %(default)s)")
+    parser.add_argument("--rounds", type=int, default=20, help="Passes over all cities")
+    args = parser.parse_args(argv)
+
+    if args.fixtures:
+        if len(args.fixtures) != 2:
+            parser.error("pass both a minimal and a full fixture")
+        fixtures = dict(zip(PROFILES, map(load_fixture, args.fixtures)))
+    else:
+        cities = [f"City {i}" for i in range(args.cities)]
+        fixtures = {name: synthetic_fixture(cities, fields=profile["fields"])
+                    for name, profile in PROFILES.items()}
+
+    print("📦 Weather field selection: minimal (temperature, °C) vs full (all fields, C/F/K)")
+    print("=" * 66)
+    results = {name: measure(fixtures[name], name, args.rounds) for name in PROFILES}
+    for name, (payload, micros) in results.items():
+        print(f"{name:<10} {payload:8.0f} bytes/response  {micros:8.1f} us/fetch")
+    print("-" * 66)
+    minimal, full = results["minimal"], results["full"]
+    print(f"Payload reduction: {(1 - minimal[0] / full[0]) * 100:.1f}%   "
+          f"Time reduction: {(1 - minimal[1] / full[1]) * 100:.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Offline Weather Fetcher Benchmark
+Replays recorded API responses with simulated latency to compare the cost of
+uncached, cached and concurrent lookups without touching the network.
+
+Usage:
+    python3 benchmark_weather_replay.py                 # synthetic fixture
+    python3 benchmark_weather_replay.py fixture.json    # recorded fixture
+"""
+
+import argparse
+import json
+import time
+import urllib.parse
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from weather_fetcher import WeatherFetcher, DEFAULT_FIELDS
+from weather_transport import Transport, RecordingTransport, ReplayTransport, load_fixture
+
+
+CITIES = ["London", "Tokyo", "New York", "Sydney", "Cairo", "Paris", "Lima", "Oslo"]
+
+
+class SyntheticTransport(Transport):
+    """Generates Open-Meteo shaped responses so a fixture can be built offline"""
+
+    def get_text(self, url, timeout=10):
+        parsed = urllib.parse.urlparse(url)
+        params = dict(urllib.parse.parse_qsl(parsed.query))
+        seed = zlib.crc32(url.encode())
+
+        if parsed.netloc.startswith("geocoding-api"):
+            name = params["name"]
+            name_seed = zlib.crc32(name.encode())
+            return json.dumps({"results": [{
+                "latitude": round((name_seed % 18000) / 100 - 90, 4),
+                "longitude": round((name_seed // 18000 % 36000) / 100 - 180, 4),
+                "name": name,
+                "country": "Testland",
+                "admin1": "Test Region",
+            }]})
+
+        if parsed.netloc.startswith("ip-api"):
+            return json.dumps({"lat": 37.7749, "lon": -122.4194, "city": "San Francisco",
+                               "regionName": "California", "country": "United States"})
+
+        values = {
+            "temperature_2m": round((seed % 500) / 10 - 10, 1),
+            "relative_humidity_2m": seed % 100,
+            "wind_speed_10m": round((seed % 300) / 10, 1),
+            "weather_code": seed % 4,
+        }
+        variables = params.get("current", "").split(",")
+        current = {"time": "2025-05-28T12:00", "interval": 900}
+        current.update({name: values[name] for name in variables if name in values})
+        return json.dumps({
+            "latitude": float(params.get("latitude", 0)),
+            "longitude": float(params.get("longitude", 0)),
+            "generationtime_ms": 0.03,
+            "utc_offset_seconds": 0,
+            "timezone": "GMT",
+            "timezone_abbreviation": "GMT",
+            "elevation": 10.0,
+            "current_units": {"time": "iso8601", "interval": "seconds",
+                              **{name: "unit" for name in variables if name in values}},
+            "current": current,
+        })
+
+
+def synthetic_fixture(cities=CITIES, fields=DEFAULT_FIELDS):
+    """
+    Build a {url: body} fixture by recording synthetic responses
+
+    Args:
+        cities (list): Location names to include
+        fields (iterable): WeatherFetcher fields to request while recording
+
+    Returns:
+        dict: Recorded responses suitable for ReplayTransport
+    """
+    recorder = RecordingTransport(path=None, inner=SyntheticTransport())
+    fetcher = WeatherFetcher(transport=recorder, fields=fields)
+    for city in cities:
+        fetcher.fetch_current_temperature(city)
+    return recorder.responses
+
+
+def fixture_locations(responses):
+    """
+    Location names that were geocoded while recording a fixture
+
+    Names come from the name= query of each geocoding URL, exactly as they
+    were looked up; the geocoded result's own name can differ (a recorded
+    "new york" returns "New York") and would miss the fixture on replay.
+    """
+    names = []
+    for url in responses:
+        parsed = urllib.parse.urlparse(url)
+        if parsed.netloc.startswith("geocoding-api"):
+            names += urllib.parse.parse_qs(parsed.query).get("name", [])
+    return names
+
+
+def timed(label, func, lookups):
+    """Run func() and print throughput"""
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<34} {elapsed * 1000:9.1f} ms  {lookups / elapsed:9.1f} lookups/s")
+
+
+def main(argv=None):
+    """Run the replay benchmarks"""
+    parser = argparse.ArgumentParser(description="Benchmark WeatherFetcher against replayed responses.")
+    parser.add_argument("fixture", nargs="?", help="Recorded fixture file (synthetic if omitted)")
+    parser.add_argument("--rounds", type=int, default=5, help="Lookups per city (default: %(default)s)")
+    parser.add_argument("--latency", type=float, default=0.01, help="Simulated latency in seconds")
+    parser.add_argument("--jitter", type=float, default=0.002, help="Simulated latency jitter in seconds")
+    parser.add_argument("--workers", type=int, default=8, help="Threads for the concurrent run")
+    args = parser.parse_args(argv)
+
+    responses = load_fixture(args.fixture) if args.fixture else synthetic_fixture()
+    cities = fixture_locations(responses)
+    lookups = len(cities) * args.rounds
+
+    def transport():
+        return ReplayTransport(responses, latency=args.latency, jitter=args.jitter, seed=0)
+
+    def uncached():
+        for _ in range(args.rounds):
+            for city in cities:
+                WeatherFetcher(transport=transport()).fetch_current_temperature(city)
+
+    def cached():
+        fetcher = WeatherFetcher(transport=transport())
+        for _ in range(args.rounds):
+            for city in cities:
+                fetcher.fetch_current_temperature(city)
+
+    def concurrent():
+        fetcher = WeatherFetcher(transport=transport())
+        with ThreadPoolExecutor(max_workers=args.workers) as pool:
+            list(pool.map(fetcher.fetch_current_temperature, cities * args.rounds))
+
+    print(f"🏁 Replaying {len(responses)} responses, {lookups} lookups, "
+          f"latency {args.latency * 1000:.1f}±{args.jitter * 1000:.1f} ms")
+    print("-" * 66)
+    timed("Sequential, no geocoding cache", uncached, lookups)
+    timed("Sequential, geocoding cache", cached, lookups)
+    timed(f"{args.workers} threads, geocoding cache", concurrent, lookups)
+
+
+if __name__ == "__main__":
+    main()
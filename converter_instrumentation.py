@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""
+Opt-in instrumentation for TempConverter
+Counts conversions per unit pair and validation failures by reason, and
+samples time spent in the scalar, batch and buffer conversion paths.
+
+Enabling installs a ConversionStats object as temp_converter._probe. While it
+is unset the conversion methods skip instrumentation after one global lookup.
+While it is set, scalar convert() calls are sampled: each thread counts down a
+random gap averaging sample_every calls, and the call that reaches zero is
+timed and counted with weight sample_every. Per-pair and scalar call counts are
+therefore estimates unless sample_every is 1. Batch and buffer calls are always
+counted, with one in sample_every timed, and every validation failure is
+counted where it is raised.
+"""
+
+import random
+import threading
+import time
+import temp_converter
+
+
+PATHS = ("scalar", "batch", "buffer")
+
+_enable_lock = threading.Lock()
+_perf_counter = time.perf_counter
+
+
+class _Counters:
+    """One thread's counters; only ever written by the thread that owns it"""
+
+    def __init__(self):
+        # Keyed by the unit strings exactly as passed; normalized on export
+        # so the hot path doesn't pay for upper()
+        self.raw_calls = {}
+        self.failures = {}
+        self.batch_values = 0   # Values through the batch and buffer paths
+        self.path_calls = dict.fromkeys(PATHS, 0)
+        self.sampled_calls = dict.fromkeys(PATHS, 0)
+        self.sampled_seconds = dict.fromkeys(PATHS, 0.0)
+        # The sampled scalar path updates plain attributes, folded into the
+        # per-path dicts when merged
+        self.scalar_calls = 0
+        self.scalar_samples = 0
+        self.scalar_seconds = 0.0
+        self.active = False   # Set while this thread runs a call for the probe
+        self.countdown = 0    # Scalar calls left until this thread's next sample
+        self.rng = random.Random()
+
+
+class ConversionStats:
+    """
+    Counters collected while instrumentation is enabled
+
+    Each thread counts into its own _Counters, including its scalar sampling
+    countdown and random generator, so the conversion paths never write state
+    shared between threads and recording stays exact without the GIL. Exports
+    merge the per-thread counters.
+    """
+
+    def __init__(self, sample_every=64):
+        """
+        Args:
+            sample_every (int): Sample one call in this many per path
+        """
+        _check_sample_every(sample_every)
+        self.sample_every = sample_every
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Zero all counters"""
+        with self._lock:
+            self.local = threading.local()   # .counters; read by temp_converter
+            self._shards = []
+
+    def counters(self):
+        """Return the calling thread's counters, creating them on first use"""
+        try:
+            return self.local.counters
+        except AttributeError:
+            counters = _Counters()
+            counters.countdown = self._gap(counters)
+            with self._lock:
+                self._shards.append(counters)
+            self.local.counters = counters
+            return counters
+
+    def _gap(self, counters):
+        """
+        Draw the number of scalar calls until a thread's next sample
+
+        Gaps are uniform over 1 .. 2 * sample_every - 1, so they average
+        sample_every and periodic call sequences can't line up with them.
+        """
+        return int(counters.rng.random() * (2 * self.sample_every - 1)) + 1
+
+    # Probe interface called from temp_converter while enabled
+
+    def observing(self):
+        """Check whether this thread is already running a call for the probe"""
+        try:
+            return self.local.counters.active
+        except AttributeError:
+            return False
+
+    def record_failure(self, reason):
+        """Count a validation failure at the point it is raised"""
+        failures = self.counters().failures
+        failures[reason] = failures.get(reason, 0) + 1
+
+    def sample_scalar(self, cls, temperature, from_unit, to_unit):
+        """Time one sampled convert() call and count it as sample_every calls"""
+        counters = self.counters()
+        # + 1 covers the nested call below, which counts down too
+        counters.countdown = self._gap(counters) + 1
+        counters.active = True
+        start = _perf_counter()
+        try:
+            result = cls.convert(temperature, from_unit, to_unit)
+        finally:
+            elapsed = _perf_counter() - start
+            counters.active = False
+            weight = self.sample_every
+            counters.scalar_seconds += elapsed
+            counters.scalar_samples += 1
+            counters.scalar_calls += weight
+        raw_calls = counters.raw_calls
+        key = (from_unit, to_unit)
+        raw_calls[key] = raw_calls.get(key, 0) + weight
+        return result
+
+    def observe_batch(self, path, method, args):
+        """Count one batch or buffer call exactly, timing one in sample_every"""
+        counters = self.counters()
+        count = counters.path_calls[path] = counters.path_calls[path] + 1
+        counters.active = True
+        try:
+            if count % self.sample_every:
+                result = method(*args)
+            else:
+                start = _perf_counter()
+                result = method(*args)
+                counters.sampled_seconds[path] += _perf_counter() - start
+                counters.sampled_calls[path] += 1
+        finally:
+            counters.active = False
+        key = (args[1], args[2])
+        counters.raw_calls[key] = counters.raw_calls.get(key, 0) + 1
+        if path == "buffer":
+            # result is the buffer written to; count values, not bytes
+            counters.batch_values += len(temp_converter._float_view(result, args[4]))
+        else:
+            counters.batch_values += len(result)
+        return result
+
+    def merged(self):
+        """Sum every thread's counters into one _Counters"""
+        total = _Counters()
+        with self._lock:
+            shards = list(self._shards)
+        for shard in shards:
+            for key, count in list(shard.raw_calls.items()):
+                key = (key[0].upper(), key[1].upper())
+                total.raw_calls[key] = total.raw_calls.get(key, 0) + count
+            for reason, count in list(shard.failures.items()):
+                total.failures[reason] = total.failures.get(reason, 0) + count
+            total.batch_values += shard.batch_values
+            for path in PATHS:
+                total.path_calls[path] += shard.path_calls[path]
+                total.sampled_calls[path] += shard.sampled_calls[path]
+                total.sampled_seconds[path] += shard.sampled_seconds[path]
+            total.path_calls["scalar"] += shard.scalar_calls
+            total.sampled_calls["scalar"] += shard.scalar_samples
+            total.sampled_seconds["scalar"] += shard.scalar_seconds
+        return total
+
+    @staticmethod
+    def _estimated_seconds(totals, path):
+        """Extrapolate total time in a path from the sampled calls"""
+        sampled = totals.sampled_calls[path]
+        if not sampled:
+            return 0.0
+        return totals.sampled_seconds[path] * totals.path_calls[path] / sampled
+
+    def to_dict(self):
+        """
+        Export the counters as plain data
+
+        Returns:
+            dict: calls keyed by "C->F" style pairs, failures by reason,
+                  and per-path call counts and time
+        """
+        totals = self.merged()
+        return {
+            "sample_every": self.sample_every,
+            "calls": {f"{src}->{dst}": count for (src, dst), count in sorted(totals.raw_calls.items())},
+            "failures": dict(sorted(totals.failures.items())),
+            "batch_values": totals.batch_values,
+            "paths": {
+                path: {
+                    "calls": totals.path_calls[path],
+                    "sampled_calls": totals.sampled_calls[path],
+                    "sampled_seconds": totals.sampled_seconds[path],
+                    "estimated_seconds": self._estimated_seconds(totals, path),
+                }
+                for path in PATHS
+            },
+        }
+
+    def to_prometheus(self, prefix="tempconverter"):
+        """
+        Export the counters in the Prometheus text exposition format
+
+        Returns:
+            str: Metrics text, ending with a newline
+        """
+        totals = self.merged()
+        lines = [
+            f"# HELP {prefix}_conversions_total Conversions by unit pair (scalar calls are sampled).",
+            f"# TYPE {prefix}_conversions_total counter",
+        ]
+        for (src, dst), count in sorted(totals.raw_calls.items()):
+            lines.append(f'{prefix}_conversions_total{{from_unit="{src}",to_unit="{dst}"}} {count}')
+
+        lines += [
+            f"# HELP {prefix}_validation_failures_total Rejected conversions by reason.",
+            f"# TYPE {prefix}_validation_failures_total counter",
+        ]
+        for reason, count in sorted(totals.failures.items()):
+            lines.append(f'{prefix}_validation_failures_total{{reason="{reason}"}} {count}')
+
+        lines += [
+            f"# HELP {prefix}_batch_values_total Values converted through the batch and buffer paths.",
+            f"# TYPE {prefix}_batch_values_total counter",
+            f"{prefix}_batch_values_total {totals.batch_values}",
+            f"# HELP {prefix}_path_calls_total Calls by conversion path (scalar is sampled).",
+            f"# TYPE {prefix}_path_calls_total counter",
+        ]
+        for path in PATHS:
+            lines.append(f'{prefix}_path_calls_total{{path="{path}"}} {totals.path_calls[path]}')
+
+        lines += [
+            f"# HELP {prefix}_path_seconds_total Estimated time by conversion path (sampled).",
+            f"# TYPE {prefix}_path_seconds_total counter",
+        ]
+        for path in PATHS:
+            seconds = self._estimated_seconds(totals, path)
+            lines.append(f'{prefix}_path_seconds_total{{path="{path}"}} {seconds:.9f}')
+
+        return "\n".join(lines) + "\n"
+
+
+def _check_sample_every(sample_every):
+    """Raise ValueError unless sample_every is at least 1"""
+    if sample_every < 1:
+        raise ValueError("sample_every must be at least 1")
+
+
+def enable(sample_every=64):
+    """
+    Start collecting conversion statistics
+
+    Calling enable() again keeps the existing counters and only changes the
+    sampling rate.
+
+    Args:
+        sample_every (int): Sample one call in this many per path; 1 counts
+                            and times every call exactly
+
+    Returns:
+        ConversionStats: The live statistics object
+    """
+    with _enable_lock:
+        stats = temp_converter._probe
+        if stats is None:
+            stats = ConversionStats(sample_every)
+        else:
+            _check_sample_every(sample_every)
+            stats.sample_every = sample_every
+        temp_converter._probe = stats
+        return stats
+
+
+def disable():
+    """Stop collecting; conversions go back to skipping instrumentation"""
+    with _enable_lock:
+        temp_converter._probe = None
+
+
+def is_enabled():
+    """Check whether instrumentation is active"""
+    return temp_converter._probe is not None
+
+
+def reset():
+    """Zero the counters without disabling instrumentation"""
+    stats = temp_converter._probe
+    if stats is not None:
+        stats.reset()
+
+
+def snapshot():
+    """Current counters as a dict, or None when disabled"""
+    stats = temp_converter._probe
+    return stats.to_dict() if stats is not None else None
+
+
+def to_prometheus(prefix="tempconverter"):
+    """Current counters as Prometheus text, or an empty string when disabled"""
+    stats = temp_converter._probe
+    return stats.to_prometheus(prefix) if stats is not None else ""
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Spatial Reading Cache
+Indexes recent weather readings by coordinates so a query can be answered
+from the nearest fresh reading within a radius instead of a new API call.
+
+Readings are bucketed into a lat/lon grid whose cells are about one radius
+across, so a lookup only inspects the handful of cells that can hold a match.
+"""
+
+import math
+import threading
+import time
+from collections import deque
+
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE = math.pi * EARTH_RADIUS_KM / 180
+
+
+def haversine_km(lat1, lon1, lat2, lon2):
+    """Great-circle distance between two points in kilometres"""
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    dphi = phi2 - phi1
+    dlambda = math.radians(lon2 - lon1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+class ReadingIndex:
+    """Grid-bucketed cache of readings, looked up by nearest fresh neighbour"""
+
+    def __init__(self, radius_km=5.0, max_age=600, max_entries=200000, clock=time.monotonic):
+        """
+        Args:
+            radius_km (float): Serve readings taken at most this far from the query
+            max_age (float): Serve readings at most this many seconds old
+            max_entries (int): Drop the oldest readings beyond this many
+            clock (callable): Monotonic time source
+        """
+        if radius_km <= 0 or max_age <= 0 or max_entries < 1:
+            raise ValueError("radius_km, max_age and max_entries must be positive")
+
+        self.radius_km = radius_km
+        self.max_age = max_age
+        self.max_entries = max_entries
+        self.clock = clock
+
+        self._cell_deg = min(radius_km / KM_PER_DEGREE, 180.0)
+        self._columns = max(1, math.ceil(360 / self._cell_deg))
+        self._cells = {}        # (row, column) -> [entry]
+        self._order = deque()   # entries, oldest first
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _cell(self, latitude, longitude):
+        row = math.floor((latitude + 90) / self._cell_deg)
+        column = math.floor((longitude + 180) / self._cell_deg) % self._columns
+        return row, column
+
+    def insert(self, latitude, longitude, reading, timestamp=None):
+        """
+        Add a reading taken at the given coordinates
+
+        Args:
+            latitude (float): Latitude in degrees
+            longitude (float): Longitude in degrees
+            reading: Any object to hand back from nearest()
+            timestamp (float, optional): When it was taken, defaults to clock()
+        """
+        if timestamp is None:
+            timestamp = self.clock()
+        cell = self._cell(latitude, longitude)
+        entry = (latitude, longitude, timestamp, reading, cell)
+        with self._lock:
+            self._cells.setdefault(cell, []).append(entry)
+            self._order.append(entry)
+            self._evict(timestamp)
+
+    def _evict(self, now):
+        """Drop readings that are too old or over the size limit (lock held)"""
+        cutoff = now - self.max_age
+        order = self._order
+        while order and (len(order) > self.max_entries or order[0][2] < cutoff):
+            entry = order.popleft()
+            bucket = self._cells[entry[4]]
+            bucket.remove(entry)
+            if not bucket:
+                del self._cells[entry[4]]
+
+    def nearest(self, latitude, longitude, now=None):
+        """
+        Find the closest fresh reading within the radius
+
+        Args:
+            latitude (float): Query latitude in degrees
+            longitude (float): Query longitude in degrees
+            now (float, optional): Current time, defaults to clock()
+
+        Returns:
+            tuple: (reading, distance_km, age_seconds), or None on a miss
+        """
+        if now is None:
+            now = self.clock()
+        cutoff = now - self.max_age
+        row, column = self._cell(latitude, longitude)
+
+        # A radius spans more degrees of longitude away from the equator
+        cos_lat = math.cos(math.radians(min(abs(latitude) + self._cell_deg, 90.0)))
+        if cos_lat * self._columns <= 3:
+            column_span = self._columns // 2
+        else:
+            column_span = min(math.ceil(1 / cos_lat), self._columns // 2)
+        columns = {(column + offset) % self._columns for offset in range(-column_span, column_span + 1)}
+
+        best = None
+        best_distance = self.radius_km
+        with self._lock:
+            for row_offset in (-1, 0, 1):
+                for col in columns:
+                    bucket = self._cells.get((row + row_offset, col))
+                    if not bucket:
+                        continue
+                    for entry in bucket:
+                        if entry[2] < cutoff:
+                            continue
+                        distance = haversine_km(latitude, longitude, entry[0], entry[1])
+                        if distance <= best_distance:
+                            best, best_distance = entry, distance
+            if best is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return best[3], best_distance, now - best[2]
+
+    def __len__(self):
+        return len(self._order)
+
+    def hit_rate(self):
+        """Fraction of lookups served from the index"""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Lock-striped cache
+A dict-like cache split into independently locked stripes, so threads
+working on different keys rarely contend, with or without the GIL.
+"""
+
+import threading
+
+
+class StripedCache:
+    """Thread-safe mapping whose keys are spread over several locked dicts"""
+
+    def __init__(self, stripes=16):
+        """
+        Args:
+            stripes (int): Number of independently locked stripes
+        """
+        if stripes < 1:
+            raise ValueError("stripes must be at least 1")
+        self._stripes = [({}, threading.Lock()) for _ in range(stripes)]
+
+    def _stripe(self, key):
+        return self._stripes[hash(key) % len(self._stripes)]
+
+    def get(self, key, default=None):
+        """Return the cached value for key, or default"""
+        data, lock = self._stripe(key)
+        with lock:
+            return data.get(key, default)
+
+    def set(self, key, value):
+        """Store value under key"""
+        data, lock = self._stripe(key)
+        with lock:
+            data[key] = value
+
+    def setdefault(self, key, value):
+        """Store value unless key is already cached; return the cached value"""
+        data, lock = self._stripe(key)
+        with lock:
+            return data.setdefault(key, value)
+
+    def pop(self, key, default=None):
+        """Remove key and return its value, or default"""
+        data, lock = self._stripe(key)
+        with lock:
+            return data.pop(key, default)
+
+    def clear(self):
+        """Remove every entry"""
+        for data, lock in self._stripes:
+            with lock:
+                data.clear()
+
+    def __contains__(self, key):
+        data, lock = self._stripe(key)
+        with lock:
+            return key in data
+
+    def __len__(self):
+        total = 0
+        for data, lock in self._stripes:
+            with lock:
+                total += len(data)
+        return total
@@ -0,0 +1,432 @@
+#!/usr/bin/env python3
+"""
+Streaming Temperature Aggregation
+Rolling min/max/mean over sliding windows and bounded-memory quantile sketches.
+
+QuantileSketch summarizes the whole stream; WindowedQuantileSketch keeps one
+sketch per time slice and merges the slices still inside its window on read,
+giving rolling percentiles that age out like a SlidingWindow.
+
+Aggregates are kept in the unit the samples arrive in and converted on read.
+Because every C/F/K conversion is an increasing affine map, min, max, mean
+and quantiles can be converted after the fact without touching raw samples.
+"""
+
+import time
+from collections import deque
+from temp_converter import TempConverter
+
+
+def _check_sample(value, unit):
+    """Raise ValueError if value is NaN or below absolute zero in unit"""
+    # A NaN would stick in running sums and break the sketch's sort order
+    if value != value:
+        raise ValueError("Temperature sample is NaN")
+    TempConverter.convert(value, unit, unit)
+
+
+class SlidingWindow:
+    """Sliding window with O(1) amortized min/max/mean updates"""
+
+    def __init__(self, unit='C', size=None, max_age=None, clock=time.monotonic):
+        """
+        Args:
+            unit (str): Unit the samples are added in ('C', 'F', 'K')
+            size (int, optional): Keep at most this many recent samples
+            max_age (float, optional): Drop samples older than this many seconds
+            clock (callable): Time source used when no timestamp is given; once
+                              samples are added with explicit timestamps, reads
+                              expire against the newest of those instead
+        """
+        if size is None and max_age is None:
+            raise ValueError("SlidingWindow needs a size, a max_age, or both")
+        if size is not None and size < 1:
+            raise ValueError("Window size must be at least 1")
+
+        self.unit = unit.upper()
+        TempConverter.affine_coefficients(self.unit, self.unit)  # Validate unit
+        self.size = size
+        self.max_age = max_age
+        self.clock = clock
+
+        self._samples = deque()   # (seq, timestamp, value)
+        self._min = deque()       # (seq, value), values increasing
+        self._max = deque()       # (seq, value), values decreasing
+        self._sum = 0.0
+        self._seq = 0
+        self._latest = None       # Newest explicit timestamp
+
+    def add(self, value, timestamp=None):
+        """
+        Add a sample to the window
+
+        Args:
+            value (float): Temperature in the window's unit
+            timestamp (float, optional): Sample time, defaults to clock()
+
+        Raises:
+            ValueError: If the value is NaN or below absolute zero
+        """
+        _check_sample(value, self.unit)
+        if timestamp is None:
+            timestamp = self.clock()
+        elif self._latest is None or timestamp > self._latest:
+            self._latest = timestamp
+
+        seq = self._seq
+        self._seq += 1
+        self._samples.append((seq, timestamp, value))
+        self._sum += value
+
+        while self._min and self._min[-1][1] >= value:
+            self._min.pop()
+        self._min.append((seq, value))
+        while self._max and self._max[-1][1] <= value:
+            self._max.pop()
+        self._max.append((seq, value))
+
+        if self.size is not None and len(self._samples) > self.size:
+            self._evict_one()
+        self.expire(timestamp)
+
+    def extend(self, values, timestamp=None):
+        """Add several samples sharing the same timestamp"""
+        for value in values:
+            self.add(value, timestamp)
+
+    def expire(self, now=None):
+        """Drop samples older than max_age relative to now (defaults to clock())"""
+        if self.max_age is None:
+            return
+        if now is None:
+            now = self.clock()
+        cutoff = now - self.max_age
+        while self._samples and self._samples[0][1] < cutoff:
+            self._evict_one()
+
+    def _evict_one(self):
+        """Remove the oldest sample and its deque entries"""
+        seq, _, value = self._samples.popleft()
+        self._sum -= value
+        if self._min[0][0] == seq:
+            self._min.popleft()
+        if self._max[0][0] == seq:
+            self._max.popleft()
+        if not self._samples:
+            # Reset to avoid carrying float drift across an empty window
+            self._sum = 0.0
+
+    def _now(self):
+        """Time reads expire against: the newest explicit timestamp, else clock()"""
+        return self._latest if self._latest is not None else self.clock()
+
+    def __len__(self):
+        self.expire(self._now())
+        return len(self._samples)
+
+    # Reads expire first, so a clock-driven max_age window that stops
+    # receiving samples still empties out as they age
+
+    def min(self, unit=None):
+        """Smallest sample in the window, optionally converted to unit"""
+        self.expire(self._now())
+        return self._convert(self._min[0][1] if self._samples else None, unit)
+
+    def max(self, unit=None):
+        """Largest sample in the window, optionally converted to unit"""
+        self.expire(self._now())
+        return self._convert(self._max[0][1] if self._samples else None, unit)
+
+    def mean(self, unit=None):
+        """Mean of the samples in the window, optionally converted to unit"""
+        self.expire(self._now())
+        if not self._samples:
+            return None
+        return self._convert(self._sum / len(self._samples), unit)
+
+    def summary(self, unit=None):
+        """
+        Get all window aggregates at once
+
+        Args:
+            unit (str, optional): Unit to report in, defaults to the window's unit
+
+        Returns:
+            dict: count, min, max and mean (None when the window is empty)
+        """
+        # Expire once so all aggregates describe the same set of samples
+        self.expire(self._now())
+        count = len(self._samples)
+        return {
+            "unit": (unit or self.unit).upper(),
+            "count": count,
+            "min": self._convert(self._min[0][1] if count else None, unit),
+            "max": self._convert(self._max[0][1] if count else None, unit),
+            "mean": self._convert(self._sum / count if count else None, unit),
+        }
+
+    def _convert(self, value, unit):
+        """Apply the affine map from the window's unit to unit"""
+        if value is None or unit is None:
+            return value
+        scale, offset = TempConverter.affine_coefficients(self.unit, unit)
+        return value * scale + offset
+
+
+class QuantileSketch:
+    """
+    Bounded-memory quantile estimator
+
+    Samples are buffered and periodically compressed into at most about
+    2 * max_centroids weighted centroids of roughly equal weight, so rank
+    error stays around 1 / max_centroids regardless of stream length.
+    """
+
+    def __init__(self, unit='C', max_centroids=100):
+        """
+        Args:
+            unit (str): Unit the samples are added in ('C', 'F', 'K')
+            max_centroids (int): Target number of centroids kept after compression
+        """
+        if max_centroids < 2:
+            raise ValueError("max_centroids must be at least 2")
+
+        self.unit = unit.upper()
+        TempConverter.affine_coefficients(self.unit, self.unit)  # Validate unit
+        self.max_centroids = max_centroids
+
+        self._centroids = []   # sorted [(mean, weight)]
+        self._buffer = []
+        self._count = 0
+        self._min = None
+        self._max = None
+
+    def add(self, value):
+        """
+        Add a sample to the sketch
+
+        Raises:
+            ValueError: If the value is NaN or below absolute zero
+        """
+        _check_sample(value, self.unit)
+        self._buffer.append(value)
+        self._count += 1
+        if self._min is None or value < self._min:
+            self._min = value
+        if self._max is None or value > self._max:
+            self._max = value
+        if len(self._buffer) >= self.max_centroids:
+            self._compress()
+
+    def extend(self, values):
+        """Add several samples"""
+        for value in values:
+            self.add(value)
+
+    def __len__(self):
+        return self._count
+
+    def merge(self, other):
+        """
+        Fold another sketch's samples into this one
+
+        Args:
+            other (QuantileSketch): Sketch in the same unit, left unchanged
+
+        Raises:
+            ValueError: If the sketches use different units
+        """
+        if other.unit != self.unit:
+            raise ValueError(f"Can't merge a {other.unit} sketch into a {self.unit} sketch")
+        other._compress()
+        if not other._count:
+            return
+        items = sorted(self._centroids + [(value, 1) for value in self._buffer] + other._centroids)
+        self._buffer = []
+        self._count += other._count
+        self._min = other._min if self._min is None else min(self._min, other._min)
+        self._max = other._max if self._max is None else max(self._max, other._max)
+        self._centroids = self._cluster(items)
+
+    def _compress(self):
+        """Merge the buffer into the centroid list"""
+        if not self._buffer:
+            return
+        items = sorted(self._centroids + [(value, 1) for value in self._buffer])
+        self._buffer = []
+        self._centroids = self._cluster(items)
+
+    def _cluster(self, items):
+        """Group sorted (mean, weight) items into centroids of about equal weight"""
+        target = self._count / self.max_centroids
+        centroids = []
+        weight = 0
+        total = 0.0
+        for mean, w in items:
+            if weight and weight + w > target:
+                centroids.append((total / weight, weight))
+                weight = 0
+                total = 0.0
+            weight += w
+            total += mean * w
+        if weight:
+            centroids.append((total / weight, weight))
+        return centroids
+
+    def quantile(self, q, unit=None):
+        """
+        Estimate the q-th quantile
+
+        Args:
+            q (float): Quantile in [0, 1] (0.5 is the median)
+            unit (str, optional): Unit to report in, defaults to the sketch's unit
+
+        Returns:
+            float: Estimated quantile, or None if no samples were added
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("Quantile must be between 0 and 1")
+        if not self._count:
+            return None
+        self._compress()
+
+        value = self._estimate(q)
+        if unit is not None:
+            scale, offset = TempConverter.affine_coefficients(self.unit, unit)
+            value = value * scale + offset
+        return value
+
+    def _estimate(self, q):
+        """Interpolate between centroid centers at rank q * count"""
+        if q == 0:
+            return self._min
+        if q == 1:
+            return self._max
+
+        rank = q * self._count
+        prev_center, prev_mean = 0.0, self._min
+        cumulative = 0
+        for mean, weight in self._centroids:
+            center = cumulative + weight / 2
+            if rank <= center:
+                span = center - prev_center
+                fraction = (rank - prev_center) / span if span else 0.0
+                return prev_mean + (mean - prev_mean) * fraction
+            prev_center, prev_mean = center, mean
+            cumulative += weight
+
+        span = self._count - prev_center
+        fraction = (rank - prev_center) / span if span else 0.0
+        return prev_mean + (self._max - prev_mean) * fraction
+
+    def quantiles(self, qs, unit=None):
+        """Estimate several quantiles, returned as a dict keyed by q"""
+        return {q: self.quantile(q, unit) for q in qs}
+
+
+class WindowedQuantileSketch:
+    """
+    Rolling quantiles over the last max_age seconds
+
+    Samples go into one QuantileSketch per time slice of max_age / slices
+    seconds. Whole slices are dropped once they fall out of the window, so
+    the window is at most one slice wider than max_age. Reads merge the live
+    slices, costing O(slices * max_centroids).
+    """
+
+    def __init__(self, unit='C', max_age=300, slices=6, max_centroids=100, clock=time.monotonic):
+        """
+        Args:
+            unit (str): Unit the samples are added in ('C', 'F', 'K')
+            max_age (float): Report on samples from roughly the last max_age seconds
+            slices (int): Number of time slices the window is split into
+            max_centroids (int): Centroids kept per slice
+            clock (callable): Time source used when no timestamp is given; once
+                              samples are added with explicit timestamps, reads
+                              expire against the newest of those instead
+        """
+        if max_age <= 0:
+            raise ValueError("max_age must be positive")
+        if slices < 1:
+            raise ValueError("slices must be at least 1")
+
+        self.unit = unit.upper()
+        QuantileSketch(self.unit, max_centroids)  # Validate unit and max_centroids
+        self.max_age = max_age
+        self.slices = slices
+        self.max_centroids = max_centroids
+        self.clock = clock
+
+        self._width = max_age / slices
+        self._slices = deque()   # (slice index, QuantileSketch), oldest first
+        self._latest = None      # Newest explicit timestamp
+
+    def add(self, value, timestamp=None):
+        """
+        Add a sample to the current time slice
+
+        Args:
+            value (float): Temperature in the sketch's unit
+            timestamp (float, optional): Sample time, defaults to clock()
+
+        Raises:
+            ValueError: If the value is NaN or below absolute zero
+        """
+        _check_sample(value, self.unit)
+        if timestamp is None:
+            timestamp = self.clock()
+        elif self._latest is None or timestamp > self._latest:
+            self._latest = timestamp
+        index = int(timestamp // self._width)
+        # Late samples are counted in the newest slice rather than reopening an older one
+        if not self._slices or index > self._slices[-1][0]:
+            self._slices.append((index, QuantileSketch(self.unit, self.max_centroids)))
+        self._slices[-1][1].add(value)
+        self.expire(timestamp)
+
+    def extend(self, values, timestamp=None):
+        """Add several samples sharing the same timestamp"""
+        for value in values:
+            self.add(value, timestamp)
+
+    def expire(self, now=None):
+        """Drop slices that ended more than max_age before now (defaults to clock())"""
+        if now is None:
+            now = self.clock()
+        cutoff = now - self.max_age
+        while self._slices and (self._slices[0][0] + 1) * self._width <= cutoff:
+            self._slices.popleft()
+
+    def _now(self):
+        """Time reads expire against: the newest explicit timestamp, else clock()"""
+        return self._latest if self._latest is not None else self.clock()
+
+    def __len__(self):
+        self.expire(self._now())
+        return sum(len(sketch) for _, sketch in self._slices)
+
+    def _merged(self):
+        """Combine the live slices into one sketch"""
+        self.expire(self._now())
+        merged = QuantileSketch(self.unit, self.max_centroids)
+        for _, sketch in self._slices:
+            merged.merge(sketch)
+        return merged
+
+    def quantile(self, q, unit=None):
+        """
+        Estimate the q-th quantile of the samples in the window
+
+        Args:
+            q (float): Quantile in [0, 1] (0.5 is the median)
+            unit (str, optional): Unit to report in, defaults to the sketch's unit
+
+        Returns:
+            float: Estimated quantile, or None if the window is empty
+        """
+        return self._merged().quantile(q, unit)
+
+    def quantiles(self, qs, unit=None):
+        """Estimate several quantiles from one merge, returned as a dict keyed by q"""
+        merged = self._merged()
+        return {q: merged.quantile(q, unit) for q in qs}
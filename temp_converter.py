@@ -4,6 +4,30 @@ Temperature Converter POC
 A simple utility to convert temperatures between Celsius, Fahrenheit, and Kelvin.
 """
 
+from array import array
+
+try:
+    import numpy
+except ImportError:  # Optional: only speeds up convert_buffer()
+    numpy = None
+
+# Set by converter_instrumentation.enable(). While it is None, each conversion
+# method skips instrumentation after a single global lookup.
+_probe = None
+
+# (scale, offset) pairs for the affine maps into and out of Celsius
+_TO_CELSIUS = {
+    'C': (1.0, 0.0),
+    'F': (5 / 9, -32 * 5 / 9),
+    'K': (1.0, -273.15),
+}
+_FROM_CELSIUS = {
+    'C': (1.0, 0.0),
+    'F': (9 / 5, 32.0),
+    'K': (1.0, 273.15),
+}
+
+
 class TempConverter:
     """Simple temperature converter class"""
     
@@ -39,6 +63,54 @@ class TempConverter:
         celsius = TempConverter.kelvin_to_celsius(kelvin)
         return TempConverter.celsius_to_fahrenheit(celsius)
     
+    @staticmethod
+    def affine_coefficients(from_unit, to_unit):
+        """
+        Get the (scale, offset) pair such that target = source * scale + offset
+        
+        Every C/F/K conversion is affine, so this lets callers convert
+        aggregates (min, max, mean, quantiles) without the raw samples.
+        
+        Args:
+            from_unit (str): Source unit ('C', 'F', 'K')
+            to_unit (str): Target unit ('C', 'F', 'K')
+            
+        Returns:
+            tuple: (scale, offset) as floats
+            
+        Raises:
+            ValueError: If units are invalid
+        """
+        from_unit = from_unit.upper()
+        to_unit = to_unit.upper()
+        if from_unit not in _TO_CELSIUS or to_unit not in _FROM_CELSIUS:
+            if _probe is not None:
+                _probe.record_failure("invalid_unit")
+            raise ValueError(f"Units must be one of: {list(_TO_CELSIUS)}")
+        
+        if from_unit == to_unit:
+            return 1.0, 0.0
+        
+        # Compose source -> Celsius -> target
+        scale_in, offset_in = _TO_CELSIUS[from_unit]
+        scale_out, offset_out = _FROM_CELSIUS[to_unit]
+        return scale_in * scale_out, offset_in * scale_out + offset_out
+    
+    @staticmethod
+    def _check_absolute_zero(temperature, unit):
+        """Raise ValueError if temperature is below absolute zero in unit (uppercase)"""
+        if unit == 'K' and temperature < 0:
+            message = "Temperature in Kelvin cannot be negative"
+        elif unit == 'C' and temperature < -273.15:
+            message = "Temperature in Celsius cannot be below -273.15°C"
+        elif unit == 'F' and temperature < -459.67:
+            message = "Temperature in Fahrenheit cannot be below -459.67°F"
+        else:
+            return
+        if _probe is not None:
+            _probe.record_failure("below_absolute_zero")
+        raise ValueError(message)
+    
     @classmethod
     def convert(cls, temperature, from_unit, to_unit):
         """
@@ -55,21 +127,31 @@ class TempConverter:
         Raises:
             ValueError: If units are invalid or temperature is below absolute zero
         """
+        # With instrumentation enabled, unsampled calls only count down this
+        # thread's counters; the probe times a sampled call by running it
+        # through here again
+        probe = _probe
+        if probe is not None:
+            try:
+                counters = probe.local.counters
+            except AttributeError:
+                counters = probe.counters()
+            counters.countdown -= 1
+            if counters.countdown <= 0 and not counters.active:
+                return probe.sample_scalar(cls, temperature, from_unit, to_unit)
+        
         from_unit = from_unit.upper()
         to_unit = to_unit.upper()
         
         # Validate units
         valid_units = ['C', 'F', 'K']
         if from_unit not in valid_units or to_unit not in valid_units:
+            if _probe is not None:
+                _probe.record_failure("invalid_unit")
             raise ValueError(f"Units must be one of: {valid_units}")
         
         # Validate temperature (basic absolute zero checks)
-        if from_unit == 'K' and temperature < 0:
-            raise ValueError("Temperature in Kelvin cannot be negative")
-        if from_unit == 'C' and temperature < -273.15:
-            raise ValueError("Temperature in Celsius cannot be below -273.15°C")
-        if from_unit == 'F' and temperature < -459.67:
-            raise ValueError("Temperature in Fahrenheit cannot be below -459.67°F")
+        cls._check_absolute_zero(temperature, from_unit)
         
         # If same unit, return as is
         if from_unit == to_unit:
@@ -90,6 +172,145 @@ class TempConverter:
             return conversion_func(temperature)
         else:
             raise ValueError(f"Conversion from {from_unit} to {to_unit} not supported")
+    
+    @classmethod
+    def convert_batch(cls, temperatures, from_unit, to_unit):
+        """
+        Convert many temperatures between the same pair of units
+        
+        Validation happens once for the whole batch and each value goes
+        through a single multiply-add, so this is much cheaper than calling
+        convert() in a loop. Results can differ from convert() in the last
+        bits of precision.
+        
+        Args:
+            temperatures (iterable): Temperature values to convert
+            from_unit (str): Source unit ('C', 'F', 'K')
+            to_unit (str): Target unit ('C', 'F', 'K')
+            
+        Returns:
+            list: Converted temperatures, in input order
+            
+        Raises:
+            ValueError: If units are invalid or any temperature is below absolute zero
+        """
+        probe = _probe
+        if probe is not None and not probe.observing():
+            return probe.observe_batch("batch", cls.convert_batch, (temperatures, from_unit, to_unit))
+        
+        scale, offset = cls.affine_coefficients(from_unit, to_unit)
+        values = list(temperatures)
+        if values:
+            # Checking the coldest value covers the whole batch
+            cls._check_absolute_zero(_coldest(values), from_unit.upper())
+        
+        if scale == 1.0 and offset == 0.0:
+            return values
+        return [value * scale + offset for value in values]
+    
+    @classmethod
+    def convert_buffer(cls, buffer, from_unit, to_unit, out=None, format='d'):
+        """
+        Convert float32/float64 values held in any buffer-protocol object
+        
+        Works directly on the caller's memory (bytearray, memoryview,
+        array.array, mmap, ...) instead of copying it into a list. With
+        numpy installed no per-element Python objects are created at all;
+        without it values are converted in bounded chunks. Strided
+        memoryviews are supported, as are raw byte buffers that start at a
+        misaligned offset.
+        
+        Args:
+            buffer: Source buffer; typed 'f'/'d' buffers are used as-is, raw
+                    byte buffers are reinterpreted as `format`
+            from_unit (str): Source unit ('C', 'F', 'K')
+            to_unit (str): Target unit ('C', 'F', 'K')
+            out (optional): Writable buffer of the same length to receive the
+                            results; if omitted, buffer is converted in place
+            format (str): 'd' (float64) or 'f' (float32), used for raw byte buffers
+            
+        Returns:
+            The object the results were written to (out, or buffer)
+            
+        Raises:
+            ValueError: If units are invalid, any temperature is below absolute
+                        zero, the buffers don't match, or the target is read-only
+        """
+        probe = _probe
+        if probe is not None and not probe.observing():
+            return probe.observe_batch("buffer", cls.convert_buffer, (buffer, from_unit, to_unit, out, format))
+        
+        scale, offset = cls.affine_coefficients(from_unit, to_unit)
+        target = buffer if out is None else out
+        src = _float_view(buffer, format)
+        dst = src if out is None else _float_view(out, format)
+        
+        if dst.readonly:
+            raise ValueError("Output buffer is read-only")
+        if len(dst) != len(src):
+            raise ValueError(f"Output buffer holds {len(dst)} values, expected {len(src)}")
+        if not len(src):
+            return target
+        
+        if numpy is not None:
+            src_array = numpy.asarray(src)
+            dst_array = src_array if dst is src else numpy.asarray(dst)
+            # Validate before writing so a bad batch never half-converts in place;
+            # fmin skips NaN, where min() would return it and disable the check
+            cls._check_absolute_zero(float(numpy.fmin.reduce(src_array)), from_unit.upper())
+            numpy.multiply(src_array, scale, out=dst_array, casting='unsafe')
+            numpy.add(dst_array, offset, out=dst_array, casting='unsafe')
+            return target
+        
+        cls._check_absolute_zero(_coldest(src), from_unit.upper())
+        if scale == 1.0 and offset == 0.0 and dst is src:
+            return target
+        
+        # Convert in fixed-size chunks so temporary memory stays bounded
+        for start in range(0, len(src), _BUFFER_CHUNK):
+            chunk = src[start:start + _BUFFER_CHUNK]
+            dst[start:start + len(chunk)] = array(dst.format, [value * scale + offset for value in chunk])
+        return target
+
+
+# Values converted per step by the pure-Python convert_buffer() path
+_BUFFER_CHUNK = 4096
+
+
+def _coldest(values):
+    """
+    Smallest non-NaN value, or NaN if there is none
+    
+    NaN compares false both ways, so min() returns it whenever it comes first
+    and would hide colder values behind it; NaN itself passes validation just
+    as it does in convert().
+    """
+    coldest = min(values)
+    if coldest != coldest:
+        coldest = min((value for value in values if value == value), default=coldest)
+    return coldest
+
+
+def _float_view(buffer, format):
+    """Return a 1-D 'f' or 'd' memoryview over buffer without copying"""
+    view = memoryview(buffer)
+    if view.format in ('f', 'd'):
+        if view.ndim != 1:
+            if not view.c_contiguous:
+                raise ValueError("Multi-dimensional buffers must be contiguous")
+            view = view.cast('B').cast(view.format)
+        return view
+    
+    if view.format not in ('B', 'b', 'c'):
+        raise ValueError(f"Unsupported buffer format '{view.format}', expected float32 or float64")
+    if format not in ('f', 'd'):
+        raise ValueError("format must be 'f' (float32) or 'd' (float64)")
+    if not view.c_contiguous:
+        raise ValueError("Raw byte buffers must be contiguous")
+    view = view.cast('B')
+    if len(view) % array(format).itemsize:
+        raise ValueError(f"Buffer size is not a multiple of the '{format}' item size")
+    return view.cast(format)
 
 
 def main():
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Tests for the TempConverter instrumentation mode
+"""
+
+import threading
+import unittest
+from array import array
+import converter_instrumentation
+import temp_converter
+from temp_converter import TempConverter
+
+
+class TestConverterInstrumentation(unittest.TestCase):
+    """Test cases for converter_instrumentation"""
+
+    def tearDown(self):
+        converter_instrumentation.disable()
+
+    def test_enable_and_disable(self):
+        """Test that enabling installs the probe and disabling removes it"""
+        self.assertFalse(converter_instrumentation.is_enabled())
+        stats = converter_instrumentation.enable()
+        self.assertIs(temp_converter._probe, stats)
+
+        converter_instrumentation.disable()
+        self.assertIsNone(temp_converter._probe)
+        TempConverter.convert(0, 'C', 'F')
+        self.assertEqual(stats.to_dict()["paths"]["scalar"]["calls"], 0)
+        self.assertIsNone(converter_instrumentation.snapshot())
+        self.assertEqual(converter_instrumentation.to_prometheus(), "")
+
+    def test_counts_calls_per_pair(self):
+        """Test call counting per normalized unit pair"""
+        converter_instrumentation.enable(sample_every=1)
+        converter = TempConverter()
+        converter.convert(25, 'C', 'F')
+        converter.convert(25, 'c', 'f')
+        TempConverter.convert(300, 'K', 'C')
+
+        stats = converter_instrumentation.snapshot()
+        self.assertEqual(stats["calls"], {"C->F": 2, "K->C": 1})
+        self.assertEqual(stats["paths"]["scalar"]["calls"], 3)
+        self.assertEqual(stats["paths"]["scalar"]["sampled_calls"], 3)
+        self.assertGreater(stats["paths"]["scalar"]["estimated_seconds"], 0)
+
+    def test_results_unchanged(self):
+        """Test that instrumented methods return the same values"""
+        converter_instrumentation.enable()
+        self.assertAlmostEqual(TempConverter.convert(100, 'C', 'F'), 212.0)
+        self.assertEqual(TempConverter.convert_batch([0, 100], 'C', 'K'), [273.15, 373.15])
+        values = array('d', [0, 100])
+        self.assertIs(TempConverter.convert_buffer(values, 'C', 'K'), values)
+        self.assertEqual(list(values), [273.15, 373.15])
+
+    def test_counts_failures_by_reason(self):
+        """Test that validation failures are classified and still raised"""
+        converter_instrumentation.enable()
+        with self.assertRaises(ValueError):
+            TempConverter.convert(-500, 'F', 'C')
+        with self.assertRaises(ValueError):
+            TempConverter.convert(25, 'X', 'C')
+        with self.assertRaises(ValueError):
+            TempConverter.convert_batch([1, -1], 'K', 'C')
+
+        stats = converter_instrumentation.snapshot()
+        self.assertEqual(stats["failures"], {"below_absolute_zero": 2, "invalid_unit": 1})
+
+    def test_batch_path(self):
+        """Test batch path counters"""
+        converter_instrumentation.enable(sample_every=2)
+        for _ in range(4):
+            TempConverter.convert_batch([0, 10, 20], 'C', 'F')
+
+        stats = converter_instrumentation.snapshot()
+        self.assertEqual(stats["batch_values"], 12)
+        self.assertEqual(stats["paths"]["batch"]["calls"], 4)
+        self.assertEqual(stats["paths"]["batch"]["sampled_calls"], 2)
+        self.assertEqual(stats["paths"]["scalar"]["calls"], 0)
+
+    def test_buffer_path(self):
+        """Test buffer path counters, counting values rather than bytes"""
+        converter_instrumentation.enable(sample_every=1)
+        TempConverter.convert_buffer(array('d', [0, 10, 20]), 'C', 'F')
+        TempConverter.convert_buffer(bytearray(array('f', [0, 10]).tobytes()), 'C', 'K', format='f')
+        with self.assertRaises(ValueError):
+            TempConverter.convert_buffer(array('d', [1, -1]), 'K', 'C')
+
+        stats = converter_instrumentation.snapshot()
+        self.assertEqual(stats["batch_values"], 5)
+        self.assertEqual(stats["calls"], {"C->F": 1, "C->K": 1})
+        self.assertEqual(stats["failures"], {"below_absolute_zero": 1})
+        self.assertEqual(stats["paths"]["buffer"]["calls"], 3)
+        self.assertEqual(stats["paths"]["buffer"]["sampled_calls"], 2)   # The rejected call is counted, not timed
+        self.assertEqual(stats["paths"]["batch"]["calls"], 0)
+
+    def test_reset(self):
+        """Test resetting counters at runtime"""
+        converter_instrumentation.enable()
+        TempConverter.convert(0, 'C', 'F')
+        converter_instrumentation.reset()
+
+        stats = converter_instrumentation.snapshot()
+        self.assertEqual(stats["calls"], {})
+        self.assertEqual(stats["paths"]["scalar"]["calls"], 0)
+
+    def test_prometheus_export(self):
+        """Test Prometheus text output"""
+        converter_instrumentation.enable(sample_every=1)
+        TempConverter.convert(0, 'C', 'F')
+        with self.assertRaises(ValueError):
+            TempConverter.convert(-1, 'K', 'C')
+
+        text = converter_instrumentation.to_prometheus()
+        self.assertIn('tempconverter_conversions_total{from_unit="C",to_unit="F"} 1\n', text)
+        self.assertIn('tempconverter_validation_failures_total{reason="below_absolute_zero"} 1\n', text)
+        self.assertIn("# TYPE tempconverter_path_seconds_total counter", text)
+        self.assertTrue(text.endswith("\n"))
+
+    def test_sampled_scalar_estimates(self):
+        """Test that sampled scalar counts estimate the true counts"""
+        converter_instrumentation.enable(sample_every=16)
+        failures = 0
+        for i in range(16000):
+            # Alternate pairs so a fixed sampling period would see only one of them
+            if i % 2:
+                TempConverter.convert(25, 'C', 'F')
+            else:
+                TempConverter.convert(77, 'F', 'C')
+            if i % 100 == 0:
+                with self.assertRaises(ValueError):
+                    TempConverter.convert(-1, 'K', 'C')
+                failures += 1
+
+        stats = converter_instrumentation.snapshot()
+        self.assertAlmostEqual(stats["paths"]["scalar"]["calls"], 16000 + failures, delta=1600)
+        self.assertAlmostEqual(stats["calls"]["C->F"], 8000, delta=1200)
+        self.assertAlmostEqual(stats["calls"]["F->C"], 8000, delta=1200)
+        self.assertLess(stats["paths"]["scalar"]["sampled_calls"], 2000)
+        # Failures are counted where they are raised, so they stay exact
+        self.assertEqual(stats["failures"], {"below_absolute_zero": failures})
+
+    def test_exact_counts_across_threads(self):
+        """Test that per-thread counters merge without lost updates"""
+        converter_instrumentation.enable(sample_every=1)
+
+        def worker():
+            for _ in range(1000):
+                TempConverter.convert(25, 'C', 'F')
+                TempConverter.convert_batch([1, 2], 'C', 'K')
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = converter_instrumentation.snapshot()
+        self.assertEqual(stats["calls"], {"C->F": 8000, "C->K": 8000})
+        self.assertEqual(stats["paths"]["scalar"]["calls"], 8000)
+        self.assertEqual(stats["paths"]["scalar"]["sampled_calls"], 8000)
+        self.assertEqual(stats["paths"]["batch"]["sampled_calls"], 8000)
+        self.assertEqual(stats["batch_values"], 16000)
+
+    def test_sampled_estimates_across_threads(self):
+        """Test that each thread's own sampling countdown still estimates the total"""
+        converter_instrumentation.enable(sample_every=16)
+
+        def worker():
+            for _ in range(2000):
+                TempConverter.convert(25, 'C', 'F')
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = converter_instrumentation.snapshot()
+        self.assertAlmostEqual(stats["calls"]["C->F"], 16000, delta=1600)
+        self.assertEqual(stats["paths"]["scalar"]["calls"], stats["calls"]["C->F"])
+
+    def test_invalid_sample_rate(self):
+        """Test sample rate validation"""
+        with self.assertRaises(ValueError):
+            converter_instrumentation.enable(sample_every=0)
+        self.assertFalse(converter_instrumentation.is_enabled())
+
+
+if __name__ == '__main__':
+    print("Running Converter Instrumentation Tests...")
+    unittest.main(verbosity=2)
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Tests for the spatial reading cache
+"""
+
+import random
+import unittest
+from unittest.mock import MagicMock
+from spatial_cache import ReadingIndex, haversine_km
+from weather_fetcher import WeatherFetcher
+
+
+class FakeClock:
+    """Manually advanced clock"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestReadingIndex(unittest.TestCase):
+    """Test cases for ReadingIndex"""
+
+    def setUp(self):
+        self.clock = FakeClock()
+
+    def test_haversine(self):
+        """Test great-circle distance against known values"""
+        self.assertAlmostEqual(haversine_km(0, 0, 0, 1), 111.19, places=1)
+        # London to Paris is roughly 344 km
+        self.assertAlmostEqual(haversine_km(51.5074, -0.1278, 48.8566, 2.3522), 343.5, delta=1)
+
+    def test_nearest_within_radius(self):
+        """Test that the closest reading within the radius is returned"""
+        index = ReadingIndex(radius_km=5, clock=self.clock)
+        index.insert(40.0, -74.0, "far")
+        index.insert(40.02, -74.0, "near")
+
+        reading, distance, age = index.nearest(40.025, -74.0)
+        self.assertEqual(reading, "near")
+        self.assertLess(distance, 1)
+        self.assertEqual(age, 0)
+
+        self.assertIsNone(index.nearest(40.2, -74.0))
+        self.assertEqual((index.hits, index.misses), (1, 1))
+        self.assertEqual(index.hit_rate(), 0.5)
+
+    def test_matches_brute_force(self):
+        """Test lookups against a linear scan at several latitudes"""
+        rng = random.Random(11)
+        index = ReadingIndex(radius_km=10, clock=self.clock)
+        points = []
+        for i in range(3000):
+            lat = rng.uniform(-80, 80)
+            lon = rng.uniform(-180, 180)
+            points.append((lat, lon, i))
+            index.insert(lat, lon, i)
+
+        for lat, lon, _ in rng.sample(points, 100):
+            query = (lat + rng.uniform(-0.1, 0.1), lon + rng.uniform(-0.1, 0.1))
+            distances = [(haversine_km(*query, p[0], p[1]), p[2]) for p in points]
+            expected = min(distances)
+            found = index.nearest(*query)
+            if expected[0] <= 10:
+                self.assertIsNotNone(found)
+                self.assertAlmostEqual(found[1], expected[0], places=9)
+            else:
+                self.assertIsNone(found)
+
+    def test_dateline_and_high_latitude(self):
+        """Test neighbours across the antimeridian and near the poles"""
+        index = ReadingIndex(radius_km=20, clock=self.clock)
+        index.insert(0.0, 179.95, "east")
+        index.insert(85.0, 10.0, "arctic")
+
+        self.assertEqual(index.nearest(0.0, -179.95)[0], "east")
+        # At 85°N, 1.5 degrees of longitude is only ~14.5 km
+        self.assertEqual(index.nearest(85.0, 11.5)[0], "arctic")
+
+    def test_stale_readings_are_ignored_and_evicted(self):
+        """Test max_age for lookups and eviction"""
+        index = ReadingIndex(radius_km=5, max_age=60, clock=self.clock)
+        index.insert(10.0, 10.0, "old")
+
+        self.clock.now += 61
+        self.assertIsNone(index.nearest(10.0, 10.0))
+
+        index.insert(20.0, 20.0, "new")
+        self.assertEqual(len(index), 1)
+
+    def test_max_entries(self):
+        """Test that the oldest readings are dropped beyond max_entries"""
+        index = ReadingIndex(radius_km=1, max_entries=2, clock=self.clock)
+        for i in range(3):
+            index.insert(i, i, i)
+
+        self.assertEqual(len(index), 2)
+        self.assertIsNone(index.nearest(0, 0))
+        self.assertEqual(index.nearest(2, 2)[0], 2)
+
+    def test_invalid_configuration(self):
+        """Test parameter validation"""
+        with self.assertRaises(ValueError):
+            ReadingIndex(radius_km=0)
+        with self.assertRaises(ValueError):
+            ReadingIndex(max_age=-1)
+
+
+class TestWeatherFetcherNearby(unittest.TestCase):
+    """Test cases for WeatherFetcher.get_temperature_near"""
+
+    def setUp(self):
+        """Set up a fetcher whose API calls are mocked"""
+        self.fetcher = WeatherFetcher(reading_index=ReadingIndex(radius_km=5))
+        self.fetcher.fetch_weather_at = MagicMock(side_effect=lambda coords: {
+            "location": coords,
+            "temperature_celsius": 20.0,
+            "humidity": 40,
+            "wind_speed": 3.0,
+            "time": "2025-05-28T12:00"
+        })
+
+    def test_nearby_queries_hit_the_index(self):
+        """Test that only misses reach the API"""
+        first = self.fetcher.get_temperature_near(33.35, -111.79)
+        second = self.fetcher.get_temperature_near(33.36, -111.78)
+        third = self.fetcher.get_temperature_near(34.0, -111.0)
+
+        self.assertFalse(first["cache"]["hit"])
+        self.assertTrue(second["cache"]["hit"])
+        self.assertLess(second["cache"]["distance_km"], 5)
+        self.assertFalse(third["cache"]["hit"])
+        self.assertEqual(self.fetcher.fetch_weather_at.call_count, 2)
+        self.assertAlmostEqual(second["temperatures"]["fahrenheit"], 68.0)
+
+    def test_without_index(self):
+        """Test that every query is fetched when no index is configured"""
+        self.fetcher.reading_index = None
+        self.fetcher.get_temperature_near(33.35, -111.79)
+        self.fetcher.get_temperature_near(33.35, -111.79)
+        self.assertEqual(self.fetcher.fetch_weather_at.call_count, 2)
+
+
+if __name__ == '__main__':
+    print("Running Spatial Cache Tests...")
+    unittest.main(verbosity=2)
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Tests for the lock-striped cache
+"""
+
+import threading
+import unittest
+from striped_cache import StripedCache
+
+
+class TestStripedCache(unittest.TestCase):
+    """Test cases for StripedCache"""
+
+    def test_basic_operations(self):
+        """Test get/set/pop/contains/len/clear"""
+        cache = StripedCache(stripes=4)
+        self.assertIsNone(cache.get("London"))
+        self.assertEqual(cache.get("London", "missing"), "missing")
+
+        cache.set("London", 1)
+        cache.set("Tokyo", 2)
+        self.assertEqual(cache.get("London"), 1)
+        self.assertIn("Tokyo", cache)
+        self.assertEqual(len(cache), 2)
+
+        self.assertEqual(cache.setdefault("London", 99), 1)
+        self.assertEqual(cache.pop("London"), 1)
+        self.assertNotIn("London", cache)
+
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+    def test_concurrent_writers(self):
+        """Test that concurrent threads never lose entries"""
+        cache = StripedCache(stripes=8)
+
+        def writer(thread_id):
+            for i in range(500):
+                cache.set((thread_id, i), i)
+
+        threads = [threading.Thread(target=writer, args=(t,)) for t in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(cache), 8 * 500)
+        self.assertEqual(cache.get((3, 499)), 499)
+
+    def test_invalid_stripes(self):
+        """Test stripe count validation"""
+        with self.assertRaises(ValueError):
+            StripedCache(stripes=0)
+
+
+if __name__ == '__main__':
+    print("Running Striped Cache Tests...")
+    unittest.main(verbosity=2)
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Tests for the streaming temperature aggregation module
+"""
+
+import random
+import unittest
+from temp_aggregator import SlidingWindow, QuantileSketch, WindowedQuantileSketch
+from temp_converter import TempConverter
+
+
+class FakeClock:
+    """Manually advanced clock"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestSlidingWindow(unittest.TestCase):
+    """Test cases for SlidingWindow"""
+
+    def test_count_based_window(self):
+        """Test min/max/mean over the most recent samples"""
+        window = SlidingWindow(unit='C', size=3)
+        for value in [10, 30, 20, 5, 25]:
+            window.add(value, timestamp=0)
+
+        # Window now holds [20, 5, 25]
+        self.assertEqual(len(window), 3)
+        self.assertEqual(window.min(), 5)
+        self.assertEqual(window.max(), 25)
+        self.assertAlmostEqual(window.mean(), 50 / 3, places=10)
+
+    def test_matches_brute_force(self):
+        """Test against a naive recomputation over a random stream"""
+        rng = random.Random(42)
+        window = SlidingWindow(unit='F', size=50)
+        values = [rng.uniform(-40, 120) for _ in range(1000)]
+
+        for i, value in enumerate(values):
+            window.add(value, timestamp=i)
+            recent = values[max(0, i - 49):i + 1]
+            self.assertEqual(window.min(), min(recent))
+            self.assertEqual(window.max(), max(recent))
+            self.assertAlmostEqual(window.mean(), sum(recent) / len(recent), places=6)
+
+    def test_time_based_window(self):
+        """Test that samples older than max_age are dropped"""
+        clock = FakeClock()
+        window = SlidingWindow(unit='C', max_age=10, clock=clock)
+        for clock.now, value in [(0, 50), (5, 10), (12, 20)]:
+            window.add(value)
+
+        self.assertEqual(len(window), 2)
+        self.assertEqual(window.max(), 20)
+
+        window.expire(now=100)
+        self.assertEqual(len(window), 0)
+        self.assertIsNone(window.mean())
+
+    def test_reads_expire_idle_window(self):
+        """Test that reads drop aged-out samples even with no new adds"""
+        clock = FakeClock()
+        window = SlidingWindow(unit='C', max_age=10, clock=clock)
+        window.add(50)
+
+        clock.now = 1000
+        summary = window.summary()
+        self.assertEqual(summary["count"], 0)
+        self.assertIsNone(summary["min"])
+        self.assertIsNone(summary["max"])
+        self.assertIsNone(window.mean())
+
+    def test_reads_use_explicit_timestamps(self):
+        """Test that reads expire against supplied timestamps, not an unrelated clock"""
+        window = SlidingWindow(unit='C', max_age=10)
+        window.add(10, timestamp=5)
+        self.assertEqual(len(window), 1)
+        window.add(20, timestamp=12)
+        self.assertEqual(window.summary()["count"], 2)
+        window.add(30, timestamp=20)
+        self.assertEqual(window.min(), 20)
+
+    def test_convert_aggregates(self):
+        """Test converting aggregates after the fact"""
+        window = SlidingWindow(unit='C', size=10)
+        window.extend([0, 100], timestamp=0)
+
+        summary = window.summary('F')
+        self.assertEqual(summary["unit"], 'F')
+        self.assertAlmostEqual(summary["min"], 32.0, places=10)
+        self.assertAlmostEqual(summary["max"], 212.0, places=10)
+        self.assertAlmostEqual(summary["mean"], 122.0, places=10)
+        self.assertAlmostEqual(window.mean('K'), 323.15, places=10)
+
+    def test_validation(self):
+        """Test absolute zero and configuration validation"""
+        window = SlidingWindow(unit='K', size=5)
+        with self.assertRaises(ValueError):
+            window.add(-1)
+        with self.assertRaises(ValueError):
+            SlidingWindow(unit='X', size=5)
+        with self.assertRaises(ValueError):
+            SlidingWindow(unit='C')
+
+    def test_rejects_nan(self):
+        """Test that a NaN sample is rejected instead of poisoning the running mean"""
+        window = SlidingWindow(unit='C', size=3)
+        for value in [1, float('nan'), 2, 3, 4, 5]:
+            if value != value:
+                with self.assertRaises(ValueError):
+                    window.add(value)
+            else:
+                window.add(value)
+
+        self.assertEqual(window.summary(), {"unit": "C", "count": 3, "min": 3, "max": 5, "mean": 4.0})
+
+
+class TestQuantileSketch(unittest.TestCase):
+    """Test cases for QuantileSketch"""
+
+    def test_exact_for_small_streams(self):
+        """Test that small streams give exact order statistics"""
+        sketch = QuantileSketch(unit='C', max_centroids=100)
+        sketch.extend([3, 1, 2])
+
+        self.assertEqual(sketch.quantile(0), 1)
+        self.assertEqual(sketch.quantile(0.5), 2)
+        self.assertEqual(sketch.quantile(1), 3)
+
+    def test_bounded_memory_accuracy(self):
+        """Test accuracy and memory bound on a long stream"""
+        rng = random.Random(7)
+        sketch = QuantileSketch(unit='C', max_centroids=50)
+        values = [rng.uniform(-20, 40) for _ in range(20000)]
+        sketch.extend(values)
+
+        self.assertLessEqual(len(sketch._centroids), 2 * sketch.max_centroids)
+        ordered = sorted(values)
+        for q in (0.1, 0.5, 0.9, 0.99):
+            expected = ordered[int(q * (len(ordered) - 1))]
+            self.assertAlmostEqual(sketch.quantile(q), expected, delta=1.5)
+
+    def test_convert_quantiles(self):
+        """Test converting quantiles with the affine map"""
+        sketch = QuantileSketch(unit='F')
+        sketch.extend([32, 50, 212])
+
+        median_c = sketch.quantile(0.5, 'C')
+        self.assertAlmostEqual(median_c, TempConverter.convert(50, 'F', 'C'), places=10)
+        self.assertEqual(set(sketch.quantiles([0.25, 0.75], 'K')), {0.25, 0.75})
+
+    def test_empty_and_invalid(self):
+        """Test empty sketches and invalid input"""
+        sketch = QuantileSketch()
+        self.assertIsNone(sketch.quantile(0.5))
+        with self.assertRaises(ValueError):
+            sketch.quantile(1.5)
+        with self.assertRaises(ValueError):
+            sketch.add(-300)
+        with self.assertRaises(ValueError):
+            sketch.add(float('nan'))
+        self.assertEqual(len(sketch), 0)
+
+    def test_merge(self):
+        """Test that merged sketches estimate the combined stream"""
+        rng = random.Random(3)
+        low = QuantileSketch(unit='C', max_centroids=50)
+        high = QuantileSketch(unit='C', max_centroids=50)
+        low.extend(rng.uniform(0, 10) for _ in range(5000))
+        high.extend(rng.uniform(10, 20) for _ in range(5000))
+
+        low.merge(high)
+        self.assertEqual(len(low), 10000)
+        self.assertAlmostEqual(low.quantile(0.5), 10, delta=0.5)
+        self.assertAlmostEqual(low.quantile(0.9), 18, delta=0.5)
+        self.assertLessEqual(len(low._centroids), 2 * low.max_centroids)
+        with self.assertRaises(ValueError):
+            low.merge(QuantileSketch(unit='F'))
+
+
+class TestWindowedQuantileSketch(unittest.TestCase):
+    """Test cases for WindowedQuantileSketch"""
+
+    def test_old_samples_age_out(self):
+        """Test that percentiles follow the recent window, not the whole stream"""
+        clock = FakeClock()
+        sketch = WindowedQuantileSketch(unit='C', max_age=60, slices=6, clock=clock)
+        for second in range(600):
+            clock.now = second
+            # Cold for the first 9 minutes, then warm
+            sketch.add(0.0 if second < 540 else 30.0)
+
+        self.assertEqual(sketch.quantile(0.5), 30.0)
+        # The window spans at most one extra slice
+        self.assertLessEqual(len(sketch), 70)
+
+        clock.now = 700
+        self.assertEqual(len(sketch), 0)
+        self.assertIsNone(sketch.quantile(0.95))
+
+    def test_matches_recent_samples(self):
+        """Test accuracy against the samples inside the window"""
+        rng = random.Random(5)
+        clock = FakeClock()
+        sketch = WindowedQuantileSketch(unit='F', max_age=100, slices=10, clock=clock)
+        samples = []
+        for step in range(5000):
+            clock.now = step / 10
+            value = rng.uniform(30, 90) + step / 100
+            samples.append((clock.now, value))
+            sketch.add(value)
+
+        # Slices are 10 s wide; at t = 499.9 the [390, 400) slice still overlaps the window
+        recent = sorted(v for t, v in samples if t >= 390)
+        self.assertEqual(len(sketch), len(recent))
+        quantiles = sketch.quantiles([0.1, 0.5, 0.95], 'F')
+        for q, estimate in quantiles.items():
+            expected = recent[int(q * (len(recent) - 1))]
+            self.assertAlmostEqual(estimate, expected, delta=1.5)
+
+    def test_reads_use_explicit_timestamps(self):
+        """Test that reads expire against supplied timestamps, not an unrelated clock"""
+        sketch = WindowedQuantileSketch(max_age=60, slices=6)
+        sketch.extend([1, 2, 3], timestamp=5)
+        self.assertEqual(len(sketch), 3)
+        self.assertEqual(sketch.quantile(1), 3)
+
+    def test_validation(self):
+        """Test configuration validation"""
+        with self.assertRaises(ValueError):
+            WindowedQuantileSketch(max_age=0)
+        with self.assertRaises(ValueError):
+            WindowedQuantileSketch(slices=0)
+        with self.assertRaises(ValueError):
+            WindowedQuantileSketch(unit='X')
+        with self.assertRaises(ValueError):
+            WindowedQuantileSketch().add(-300)
+        sketch = WindowedQuantileSketch()
+        with self.assertRaises(ValueError):
+            sketch.add(float('nan'))
+        self.assertEqual(len(sketch), 0)
+
+
+if __name__ == '__main__':
+    print("Running Temperature Aggregator Tests...")
+    unittest.main(verbosity=2)
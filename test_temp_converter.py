@@ -3,7 +3,11 @@
 Simple tests for the Temperature Converter POC
 """
 
+import math
 import unittest
+from array import array
+from unittest.mock import patch
+import temp_converter
 from temp_converter import TempConverter
 
 
@@ -89,6 +93,48 @@ class TestTempConverter(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.converter.convert(-500, 'F', 'C')
     
+    def test_affine_coefficients(self):
+        """Test that affine coefficients agree with convert for every unit pair"""
+        for from_unit in ['C', 'F', 'K']:
+            for to_unit in ['C', 'F', 'K']:
+                scale, offset = TempConverter.affine_coefficients(from_unit, to_unit)
+                for temp in [0, 25, 300]:
+                    expected = self.converter.convert(temp, from_unit, to_unit)
+                    self.assertAlmostEqual(temp * scale + offset, expected, places=10)
+        
+        with self.assertRaises(ValueError):
+            TempConverter.affine_coefficients('X', 'C')
+    
+    def test_convert_batch(self):
+        """Test batch conversion matches scalar conversion"""
+        temps = [0, 25, 100, 273.15, 300]
+        for from_unit, to_unit in [('C', 'F'), ('F', 'C'), ('C', 'K'), ('K', 'F'), ('F', 'F')]:
+            batch = TempConverter.convert_batch(temps, from_unit, to_unit)
+            for temp, result in zip(temps, batch):
+                self.assertAlmostEqual(result, self.converter.convert(temp, from_unit, to_unit), places=10)
+        
+        self.assertEqual(TempConverter.convert_batch([], 'C', 'F'), [])
+        self.assertEqual(TempConverter.convert_batch(iter([0]), 'c', 'f'), [32.0])
+    
+    def test_convert_batch_validation(self):
+        """Test that batch conversion validates units and absolute zero"""
+        with self.assertRaises(ValueError):
+            TempConverter.convert_batch([25], 'X', 'C')
+        with self.assertRaises(ValueError):
+            TempConverter.convert_batch([25, -300, 10], 'C', 'F')
+    
+    def test_convert_batch_nan(self):
+        """Test that NaN anywhere in a batch can't hide an invalid value"""
+        nan = float('nan')
+        for temps in ([nan, -500], [-500, nan], [nan, nan, 10, -500]):
+            with self.assertRaises(ValueError):
+                TempConverter.convert_batch(temps, 'C', 'F')
+        
+        # NaN on its own converts to NaN, as with convert()
+        result = TempConverter.convert_batch([nan, 0], 'C', 'F')
+        self.assertTrue(math.isnan(result[0]))
+        self.assertEqual(result[1], 32.0)
+    
     def test_round_trip_conversions(self):
         """Test that converting back and forth gives original value"""
         original_temp = 25.0
@@ -104,6 +150,115 @@ class TestTempConverter(unittest.TestCase):
         self.assertAlmostEqual(original_temp, back_to_celsius, places=10)
 
 
+class TestConvertBuffer(unittest.TestCase):
+    """Test cases for buffer-protocol batch conversion"""
+    
+    def check_both_paths(self, test):
+        """Run test with numpy (when installed) and with the pure-Python path"""
+        if temp_converter.numpy is not None:
+            with self.subTest(path="numpy"):
+                test()
+        with self.subTest(path="pure-python"), patch.object(temp_converter, 'numpy', None):
+            test()
+    
+    def test_in_place_array(self):
+        """Test in-place conversion of an array.array"""
+        def test():
+            values = array('d', [0, 25, 100])
+            result = TempConverter.convert_buffer(values, 'C', 'F')
+            self.assertIs(result, values)
+            self.assertEqual(values.tolist(), [32.0, 77.0, 212.0])
+        self.check_both_paths(test)
+    
+    def test_float32_bytearray(self):
+        """Test raw float32 bytes, e.g. read from a socket"""
+        def test():
+            raw = bytearray(array('f', [0, 100]).tobytes())
+            TempConverter.convert_buffer(raw, 'C', 'K', format='f')
+            converted = array('f', bytes(raw)).tolist()
+            self.assertAlmostEqual(converted[0], 273.15, places=3)
+            self.assertAlmostEqual(converted[1], 373.15, places=3)
+        self.check_both_paths(test)
+    
+    def test_output_buffer(self):
+        """Test writing into a caller-supplied buffer, leaving the input untouched"""
+        def test():
+            source = bytes(array('d', [32, 212]).tobytes())  # read-only input
+            out = array('d', [0.0, 0.0])
+            result = TempConverter.convert_buffer(source, 'F', 'C', out=out)
+            self.assertIs(result, out)
+            self.assertAlmostEqual(out[0], 0.0, places=10)
+            self.assertAlmostEqual(out[1], 100.0, places=10)
+            self.assertEqual(array('d', source).tolist(), [32.0, 212.0])
+        self.check_both_paths(test)
+    
+    def test_strided_views(self):
+        """Test non-contiguous memoryviews for input and output"""
+        def test():
+            values = array('d', [0, -1, 10, -1, 20, -1])
+            out = array('d', [0.0] * 6)
+            TempConverter.convert_buffer(memoryview(values)[::2], 'C', 'K', out=memoryview(out)[1::2])
+            self.assertEqual(values.tolist(), [0, -1, 10, -1, 20, -1])
+            self.assertEqual(out.tolist(), [0.0, 273.15, 0.0, 283.15, 0.0, 293.15])
+        self.check_both_paths(test)
+    
+    def test_misaligned_buffer(self):
+        """Test float64 data starting at an odd byte offset"""
+        def test():
+            raw = bytearray(b"\x00" + array('d', [0, 100]).tobytes() + b"\x00")
+            view = memoryview(raw)[1:-1]
+            TempConverter.convert_buffer(view, 'C', 'F')
+            self.assertEqual(array('d', bytes(raw[1:-1])).tolist(), [32.0, 212.0])
+            self.assertEqual((raw[0], raw[-1]), (0, 0))
+        self.check_both_paths(test)
+    
+    def test_large_buffer(self):
+        """Test buffers spanning several conversion chunks"""
+        def test():
+            values = array('d', range(10000))
+            TempConverter.convert_buffer(values, 'K', 'C')
+            self.assertAlmostEqual(values[0], -273.15, places=10)
+            self.assertAlmostEqual(values[-1], 9999 - 273.15, places=8)
+        self.check_both_paths(test)
+    
+    def test_validation_leaves_buffer_untouched(self):
+        """Test that a value below absolute zero rejects the whole batch"""
+        def test():
+            values = array('d', [10, -300, 20])
+            with self.assertRaises(ValueError):
+                TempConverter.convert_buffer(values, 'C', 'F')
+            self.assertEqual(values.tolist(), [10, -300, 20])
+        self.check_both_paths(test)
+    
+    def test_nan_does_not_disable_validation(self):
+        """Test that NaN ahead of an invalid value still rejects the batch"""
+        def test():
+            nan = float('nan')
+            for values in (array('d', [nan, -500]), array('d', [10, nan, -500]), array('f', [nan, -500])):
+                with self.assertRaises(ValueError):
+                    TempConverter.convert_buffer(values, 'C', 'F')
+            
+            values = array('d', [nan, 0])
+            TempConverter.convert_buffer(values, 'C', 'F')
+            self.assertTrue(math.isnan(values[0]))
+            self.assertEqual(values[1], 32.0)
+        self.check_both_paths(test)
+    
+    def test_invalid_buffers(self):
+        """Test error handling for unusable buffers"""
+        with self.assertRaises(ValueError):
+            TempConverter.convert_buffer(bytes(8), 'C', 'F')  # read-only, no out
+        with self.assertRaises(ValueError):
+            TempConverter.convert_buffer(array('d', [1, 2]), 'C', 'F', out=array('d', [0]))
+        with self.assertRaises(ValueError):
+            TempConverter.convert_buffer(array('i', [1, 2]), 'C', 'F')
+        with self.assertRaises(ValueError):
+            TempConverter.convert_buffer(bytearray(7), 'C', 'F')
+        with self.assertRaises(ValueError):
+            TempConverter.convert_buffer(array('d', [1]), 'C', 'X')
+        self.assertEqual(len(TempConverter.convert_buffer(bytearray(), 'C', 'F')), 0)
+
+
 if __name__ == '__main__':
     print("Running Temperature Converter Tests...")
     unittest.main(verbosity=2) 
\ No newline at end of file
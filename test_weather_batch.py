@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Tests for the Weather Batch mode
+"""
+
+import csv
+import io
+import json
+import unittest
+from unittest.mock import MagicMock, patch
+from weather_batch import BatchRunner, parse_query, make_writer, main
+
+
+def sample_result(coords, temp_c=10.0):
+    """Build a get_temperature_at() style result"""
+    return {
+        "location": coords,
+        "temperatures": {
+            "celsius": temp_c,
+            "fahrenheit": temp_c * 9 / 5 + 32,
+            "kelvin": temp_c + 273.15
+        },
+        "additional_info": {"humidity": 50, "wind_speed": 5.0, "time": "2025-05-28T12:00"}
+    }
+
+
+class TestParseQuery(unittest.TestCase):
+    """Test cases for input line parsing"""
+
+    def test_names_and_coordinates(self):
+        """Test that names and lat/lon pairs are told apart"""
+        self.assertEqual(parse_query("  New   York \n"), (("name", "new york"), "New   York"))
+        self.assertEqual(parse_query("33.35,-111.79"), (("coords", 33.35, -111.79), (33.35, -111.79)))
+        self.assertEqual(parse_query("33.35 -111.79")[1], (33.35, -111.79))
+        self.assertIsNone(parse_query("   "))
+        self.assertIsNone(parse_query("# comment"))
+
+    def test_out_of_range_coordinates(self):
+        """Test that impossible coordinates are rejected"""
+        with self.assertRaises(ValueError):
+            parse_query("95,10")
+
+
+class TestBatchRunner(unittest.TestCase):
+    """Test cases for BatchRunner"""
+
+    def setUp(self):
+        """Set up a runner with a mocked fetcher"""
+        self.fetcher = MagicMock()
+        self.fetcher.geocode.side_effect = lambda name: (
+            None if name == "Atlantis" else {"name": name.title(), "latitude": 1.0, "longitude": 2.0}
+        )
+        self.fetcher.get_temperature_at.side_effect = sample_result
+        self.fetcher.get_temperature_near.side_effect = lambda lat, lon: {
+            **sample_result({"name": f"{lat}, {lon}", "latitude": lat, "longitude": lon}),
+            "cache": {"hit": False, "distance_km": 0.0, "age_seconds": 0.0}
+        }
+        self.rows = []
+        self.runner = BatchRunner(self.fetcher, self.rows.append, workers=4, max_pending=2)
+
+    def test_deduplicates_repeated_names(self):
+        """Test that repeated names are fetched once and every line gets a row"""
+        self.runner.run(["London", "london ", "Paris", "LONDON", "Paris"])
+
+        self.assertEqual(len(self.rows), 5)
+        self.assertEqual(sorted(row["line"] for row in self.rows), [1, 2, 3, 4, 5])
+        self.assertEqual(self.fetcher.geocode.call_count, 2)
+        self.assertEqual(self.runner.fetched, 2)
+        self.assertEqual(self.runner.cache_hits, 3)
+        for row in self.rows:
+            self.assertAlmostEqual(row["fahrenheit"], 50.0)
+
+    def test_coordinates_and_failures(self):
+        """Test lat/lon lines and per-line failures"""
+        self.runner.run(["# vehicles", "33.35,-111.79", "Atlantis", "200,0", ""])
+
+        by_query = {row["query"]: row for row in self.rows}
+        self.assertEqual(by_query["33.35,-111.79"]["latitude"], 33.35)
+        self.assertIsNone(by_query["33.35,-111.79"]["error"])
+        self.assertIn("Location not found", by_query["Atlantis"]["error"])
+        self.assertIn("out of range", by_query["200,0"]["error"])
+        self.assertEqual(self.runner.lines, 3)
+        self.assertEqual(self.runner.failures, 2)
+        self.assertIn("3 lines", self.runner.summary())
+
+    def test_index_hits_are_not_fetches(self):
+        """Test that readings served from the ReadingIndex count as cache hits only"""
+        self.fetcher.get_temperature_near.side_effect = lambda lat, lon: {
+            **sample_result({"name": f"{lat}, {lon}", "latitude": lat, "longitude": lon}),
+            "cache": {"hit": lat > 40, "distance_km": 0.0, "age_seconds": 0.0}
+        }
+        self.runner.run(["33.35,-111.79", "51.5,-0.12"])
+
+        self.assertEqual(self.runner.fetched, 1)
+        self.assertEqual(self.runner.cache_hits, 1)
+        self.assertIn("1 fetched, 1 cache hits", self.runner.summary())
+
+    def test_fetch_errors_do_not_stop_the_batch(self):
+        """Test that an exception from one fetch only fails its own lines"""
+        def flaky(coords):
+            if coords["name"] == "Tokyo":
+                raise ValueError("Error fetching weather data: timeout")
+            return sample_result(coords)
+
+        self.fetcher.get_temperature_at.side_effect = flaky
+        self.runner.run(["Tokyo", "Oslo", "tokyo"])
+
+        errors = [row for row in self.rows if row["error"]]
+        self.assertEqual(len(errors), 2)
+        self.assertEqual(self.runner.failures, 2)
+        self.assertEqual(len(self.rows), 3)
+
+
+class TestWriters(unittest.TestCase):
+    """Test cases for CSV and NDJSON output"""
+
+    def test_csv(self):
+        """Test CSV header and rows"""
+        output = io.StringIO()
+        write = make_writer(output, "csv")
+        write({"line": 1, "query": "Oslo", "celsius": 1.5, "cached": False, "error": None})
+
+        rows = list(csv.DictReader(io.StringIO(output.getvalue())))
+        self.assertEqual(rows[0]["query"], "Oslo")
+        self.assertEqual(rows[0]["celsius"], "1.5")
+
+    def test_ndjson(self):
+        """Test one JSON object per line"""
+        output = io.StringIO()
+        write = make_writer(output, "ndjson")
+        write({"line": 1, "query": "Oslo"})
+        write({"line": 2, "query": "Lima"})
+
+        lines = output.getvalue().splitlines()
+        self.assertEqual([json.loads(line)["query"] for line in lines], ["Oslo", "Lima"])
+
+
+class TestMain(unittest.TestCase):
+    """Test cases for command-line argument handling"""
+
+    def test_invalid_radius_is_a_usage_error(self):
+        """Test that a non-positive --radius exits with a usage message, not a traceback"""
+        for radius in ("0", "-1"):
+            with self.subTest(radius=radius), patch("sys.stderr", io.StringIO()) as stderr:
+                with self.assertRaises(SystemExit) as caught:
+                    main(["--radius", radius])
+                self.assertEqual(caught.exception.code, 2)
+                self.assertIn("radius_km", stderr.getvalue())
+
+    def test_missing_input_is_a_usage_error(self):
+        """Test that an unreadable input file exits with a usage message, not a traceback"""
+        with patch("sys.stderr", io.StringIO()) as stderr, patch("sys.stdout", io.StringIO()) as stdout:
+            with self.assertRaises(SystemExit) as caught:
+                main(["/nonexistent/locations.txt"])
+        self.assertEqual(caught.exception.code, 2)
+        self.assertIn("/nonexistent/locations.txt", stderr.getvalue())
+        self.assertEqual(stdout.getvalue(), "")
+
+
+if __name__ == '__main__':
+    print("Running Weather Batch Tests...")
+    unittest.main(verbosity=2)
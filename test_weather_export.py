@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Tests for the columnar reading exporter
+"""
+
+import csv
+import io
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+import weather_export
+from weather_export import ReadingExporter, COLUMNS
+
+
+def make_result(name, celsius):
+    """Build a get_temperature_in_all_formats()-style result"""
+    return {
+        "location": {"name": name, "admin1": "State", "country": "Country",
+                     "latitude": 10.0, "longitude": 20.0},
+        "temperatures": {"celsius": celsius, "fahrenheit": None, "kelvin": None},
+        "additional_info": {"humidity": 50, "wind_speed": 4.5, "time": "2025-05-28T12:00"},
+    }
+
+
+class TestReadingExporterCSV(unittest.TestCase):
+    """Test cases for the standard-library CSV path"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "readings.csv")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def read_rows(self):
+        with open(self.path, newline="", encoding="utf-8") as f:
+            return list(csv.DictReader(f))
+
+    def test_batches_and_conversion(self):
+        """Test that F/K columns are computed per batch and batches are bounded"""
+        with ReadingExporter(self.path, batch_size=2) as exporter:
+            for i, celsius in enumerate([0.0, 100.0, -40.0, 25.0, 37.0]):
+                exporter.add(make_result(f"City {i}", celsius))
+            # Two full batches written, one reading still buffered
+            self.assertEqual(exporter.batches_written, 2)
+            self.assertEqual(len(exporter._celsius), 1)
+
+        self.assertEqual((exporter.rows_written, exporter.batches_written), (5, 3))
+        rows = self.read_rows()
+        self.assertEqual(list(rows[0]), list(COLUMNS))
+        self.assertEqual([r["name"] for r in rows], [f"City {i}" for i in range(5)])
+        self.assertAlmostEqual(float(rows[1]["fahrenheit"]), 212.0)
+        self.assertAlmostEqual(float(rows[2]["fahrenheit"]), -40.0)
+        self.assertAlmostEqual(float(rows[0]["kelvin"]), 273.15)
+
+    def test_empty_export_writes_header(self):
+        """Test that closing without readings leaves a header-only CSV"""
+        ReadingExporter(self.path).close()
+        with open(self.path, encoding="utf-8") as f:
+            self.assertEqual(f.read().strip(), ",".join(COLUMNS))
+
+    def test_invalid_readings(self):
+        """Test that missing and impossible temperatures are rejected when added"""
+        exporter = ReadingExporter(self.path, batch_size=2)
+        with self.assertRaises(ValueError):
+            exporter.add_record({"name": "Nowhere"})
+        with self.assertRaises(ValueError):
+            exporter.add_record({"name": "Colder than space", "celsius": -300.0})
+
+        # Nothing was buffered, so the exporter keeps batching normally
+        exporter.add(make_result("A", 10.0))
+        exporter.add(make_result("B", 20.0))
+        self.assertEqual(exporter.batches_written, 1)
+        exporter.close()
+        self.assertEqual([r["name"] for r in self.read_rows()], ["A", "B"])
+
+    def test_close_after_failed_flush(self):
+        """Test that close() still closes the file when the last flush fails"""
+        exporter = ReadingExporter(self.path, batch_size=1)
+        exporter.add(make_result("A", 10.0))
+        output = exporter._file
+        exporter.batch_size = 10
+        exporter.add(make_result("B", 20.0))
+        with patch.object(exporter, "_write_csv", side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                exporter.close()
+        self.assertTrue(output.closed)
+
+    def test_format_selection(self):
+        """Test format inference and validation"""
+        with self.assertRaises(ValueError):
+            ReadingExporter(os.path.join(self.tmpdir.name, "readings.txt"))
+        with self.assertRaises(ValueError):
+            ReadingExporter(self.path, format="xlsx")
+        with self.assertRaises(ValueError):
+            ReadingExporter(self.path, batch_size=0)
+        with patch.object(weather_export, "pyarrow", None):
+            with self.assertRaises(ImportError):
+                ReadingExporter(os.path.join(self.tmpdir.name, "readings.parquet"))
+
+    def test_main_reads_ndjson(self):
+        """Test the CLI skips failed, invalid and malformed lines and exports the rest"""
+        lines = [
+            json.dumps({"query": "a", "name": "A", "celsius": 10.0, "error": None}),
+            json.dumps({"query": "b", "error": "Location not found: b"}),
+            "",
+            json.dumps({"query": "c", "name": "C", "celsius": 20.0, "error": None}),
+            json.dumps({"query": "d", "name": "D", "celsius": -300.0, "error": None}),
+            '{"query": "e", "name": "E", "cels',
+            "[]",
+        ]
+        with patch("sys.stdin", io.StringIO("\n".join(lines) + "\n")), \
+             patch("sys.stderr", io.StringIO()) as stderr:
+            weather_export.main([self.path])
+
+        self.assertEqual([r["name"] for r in self.read_rows()], ["A", "C"])
+        self.assertIn("Wrote 2 readings in 1 batches", stderr.getvalue())
+        self.assertIn("4 skipped", stderr.getvalue())
+
+
+@unittest.skipUnless(weather_export.pyarrow, "pyarrow is not installed")
+class TestReadingExporterArrow(unittest.TestCase):
+    """Test cases for the Parquet and Arrow IPC paths"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def export(self, filename):
+        path = os.path.join(self.tmpdir.name, filename)
+        with ReadingExporter(path, batch_size=3) as exporter:
+            for i in range(7):
+                exporter.add(make_result(f"City {i}", float(i * 10)))
+        return path
+
+    def check_table(self, table):
+        self.assertEqual(table.column_names, list(COLUMNS))
+        self.assertEqual(table.num_rows, 7)
+        self.assertEqual(table.column("fahrenheit").to_pylist()[:2], [32.0, 50.0])
+        self.assertAlmostEqual(table.column("kelvin").to_pylist()[6], 333.15)
+
+    def test_parquet(self):
+        """Test that each batch becomes a Parquet row group"""
+        import pyarrow.parquet
+        path = self.export("readings.parquet")
+        self.assertEqual(pyarrow.parquet.ParquetFile(path).num_row_groups, 3)
+        self.check_table(pyarrow.parquet.read_table(path))
+
+    def test_ipc(self):
+        """Test Arrow IPC file output"""
+        import pyarrow.ipc
+        path = self.export("readings.arrow")
+        with pyarrow.ipc.open_file(path) as reader:
+            self.assertEqual(reader.num_record_batches, 3)
+            self.check_table(reader.read_all())
+
+
+if __name__ == '__main__':
+    print("Running Weather Export Tests...")
+    unittest.main(verbosity=2)
@@ -124,6 +124,20 @@ class TestWeatherFetcher(unittest.TestCase):
         self.assertEqual(result["wind_speed"], 10.5)
         self.assertEqual(result["location"]["name"], "New York")
     
+    @patch('urllib.request.urlopen')
+    def test_get_location_coordinates_cached(self, mock_urlopen):
+        """Test that repeated lookups for the same name reuse the geocoding result"""
+        mock_response = MagicMock()
+        mock_response.read.return_value.decode.return_value = json.dumps(self.sample_geocoding_response)
+        mock_urlopen.return_value.__enter__.return_value = mock_response
+        
+        first = self.fetcher.get_location_coordinates("New York")
+        first["name"] = "Changed by caller"
+        second = self.fetcher.get_location_coordinates("New York")
+        
+        self.assertEqual(mock_urlopen.call_count, 1)
+        self.assertEqual(second["name"], "New York")
+    
     def test_get_location_coordinates_fallback(self):
         """Test fallback to default location when APIs fail"""
         with patch('urllib.request.urlopen', side_effect=Exception("Network error")):
@@ -157,6 +171,45 @@ class TestWeatherFetcher(unittest.TestCase):
         self.assertEqual(result["latitude"], 37.7749)
         self.assertEqual(result["longitude"], -122.4194)
     
+    @patch('urllib.request.urlopen')
+    def test_default_fields_skip_weather_code(self, mock_urlopen):
+        """Test that the default request only asks for variables that get used"""
+        mock_response = MagicMock()
+        mock_response.read.return_value.decode.return_value = json.dumps(self.sample_weather_response)
+        mock_urlopen.return_value.__enter__.return_value = mock_response
+        
+        self.fetcher.fetch_weather_at({"latitude": 40.7128, "longitude": -74.0060})
+        
+        url = mock_urlopen.call_args[0][0]
+        self.assertIn("current=temperature_2m%2Crelative_humidity_2m%2Cwind_speed_10m&", url)
+    
+    @patch('urllib.request.urlopen')
+    def test_field_selection(self, mock_urlopen):
+        """Test requesting and parsing only the declared fields and units"""
+        mock_response = MagicMock()
+        mock_response.read.return_value.decode.return_value = json.dumps(self.sample_weather_response)
+        mock_urlopen.return_value.__enter__.return_value = mock_response
+        
+        fetcher = WeatherFetcher(fields=("temperature", "weather_code"), units=('f',))
+        result = fetcher.get_temperature_at({"latitude": 40.7128, "longitude": -74.0060, "name": "New York"})
+        
+        url = mock_urlopen.call_args[0][0]
+        self.assertIn("current=temperature_2m%2Cweather_code&", url)
+        self.assertEqual(result["temperatures"], {"fahrenheit": 77.0})
+        self.assertIsNone(result["additional_info"]["humidity"])
+        self.assertEqual(result["additional_info"]["weather_code"], 0)
+    
+    def test_invalid_field_selection(self):
+        """Test validation of fields and units"""
+        with self.assertRaises(ValueError):
+            WeatherFetcher(fields=("temperature", "pressure"))
+        with self.assertRaises(ValueError):
+            WeatherFetcher(fields=("humidity",))
+        with self.assertRaises(ValueError):
+            WeatherFetcher(units=('R',))
+        with self.assertRaises(ValueError):
+            WeatherFetcher(units=())
+    
     def test_error_handling_invalid_location(self):
         """Test error handling for invalid locations"""
         with patch.object(self.fetcher, 'get_location_coordinates', return_value=None):
@@ -254,6 +307,25 @@ class TestWeatherFetcher(unittest.TestCase):
             self.assertIn("77.0", output_text)  # Fahrenheit
             self.assertIn("298.1", output_text)  # Kelvin
             self.assertIn("Test City", output_text)  # Location
+    
+    @patch('builtins.print')
+    def test_display_weather_report_selected_units(self, mock_print):
+        """Test that the report only prints the units the fetcher was asked for"""
+        fetcher = WeatherFetcher(units=('C',))
+        with patch.object(fetcher, 'get_temperature_in_all_formats') as mock_get:
+            mock_get.return_value = {
+                "location": {"name": "Test City"},
+                "temperatures": {"celsius": 25.0},
+                "additional_info": {"time": "2025-05-28T12:00"}
+            }
+            
+            fetcher.display_weather_report("Test City")
+        
+        output_text = " ".join(str(call) for call in mock_print.call_args_list)
+        self.assertIn("25.0°C (Celsius)", output_text)
+        self.assertNotIn("Fahrenheit", output_text)
+        self.assertNotIn("Kelvin", output_text)
+        self.assertNotIn("Error", output_text)
 
 
 class TestWeatherFetcherIntegration(unittest.TestCase):
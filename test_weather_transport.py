@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Tests for the Weather Fetcher record/replay transports
+"""
+
+import json
+import os
+import socket
+import tempfile
+import unittest
+import urllib.error
+from weather_fetcher import WeatherFetcher
+from weather_transport import Transport, RecordingTransport, ReplayTransport, load_fixture
+
+
+GEOCODING_BODY = json.dumps({"results": [{
+    "latitude": 51.5085, "longitude": -0.1257, "name": "London",
+    "country": "United Kingdom", "admin1": "England"
+}]})
+
+WEATHER_BODY = json.dumps({
+    "current": {"time": "2025-05-28T12:00", "temperature_2m": 18.5,
+                "relative_humidity_2m": 70, "wind_speed_10m": 12.0},
+    "timezone": "Europe/London"
+})
+
+
+class FakeNetwork(Transport):
+    """Stands in for the live network and counts requests"""
+
+    def __init__(self):
+        self.urls = []
+
+    def get_text(self, url, timeout=10):
+        self.urls.append(url)
+        return GEOCODING_BODY if "geocoding-api" in url else WEATHER_BODY
+
+
+class TestWeatherTransport(unittest.TestCase):
+    """Test cases for RecordingTransport and ReplayTransport"""
+
+    def setUp(self):
+        """Record a London lookup into a temporary fixture file"""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.fixture_path = os.path.join(self.tmpdir.name, "fixture.json")
+        self.network = FakeNetwork()
+        with RecordingTransport(self.fixture_path, inner=self.network) as recorder:
+            WeatherFetcher(transport=recorder).fetch_current_temperature("London")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_recording_writes_fixture(self):
+        """Test that every response is captured in the fixture file"""
+        responses = load_fixture(self.fixture_path)
+        self.assertEqual(set(responses), set(self.network.urls))
+        self.assertEqual(len(responses), 2)
+
+    def test_replay_without_network(self):
+        """Test that a replayed fetch matches the recorded one"""
+        transport = ReplayTransport(self.fixture_path)
+        result = WeatherFetcher(transport=transport).get_temperature_in_all_formats("London")
+
+        self.assertEqual(result["location"]["name"], "London")
+        self.assertEqual(result["temperatures"]["celsius"], 18.5)
+        self.assertAlmostEqual(result["temperatures"]["fahrenheit"], 65.3, places=5)
+        self.assertEqual(transport.requests, 2)
+
+    def test_simulated_latency_and_jitter(self):
+        """Test that latency is applied within the jitter bounds"""
+        delays = []
+        transport = ReplayTransport(self.fixture_path, latency=0.05, jitter=0.01,
+                                    seed=1, sleep=delays.append)
+        fetcher = WeatherFetcher(transport=transport)
+        for _ in range(5):
+            fetcher.fetch_current_temperature("London")
+
+        # One geocoding request (then cached) plus five forecast requests
+        self.assertEqual(len(delays), 6)
+        for delay in delays:
+            self.assertGreaterEqual(delay, 0.04)
+            self.assertLessEqual(delay, 0.06)
+
+    def test_latency_beyond_timeout(self):
+        """Test that a delay longer than the timeout fails like a real timeout"""
+        delays = []
+        transport = ReplayTransport(self.fixture_path, latency=5.0, sleep=delays.append)
+        url = next(iter(transport.responses))
+        with self.assertRaises(urllib.error.URLError) as cm:
+            transport.get_text(url, timeout=2)
+
+        self.assertIsInstance(cm.exception.reason, socket.timeout)
+        self.assertEqual(delays, [2])
+        self.assertEqual(transport.errors, 1)
+        # Within the timeout the same request succeeds
+        self.assertEqual(transport.get_text(url, timeout=10), transport.responses[url])
+
+    def test_simulated_errors(self):
+        """Test that simulated errors surface like network errors"""
+        transport = ReplayTransport(self.fixture_path, error_rate=1.0)
+        with self.assertRaises(urllib.error.URLError):
+            transport.get_json(next(iter(transport.responses)))
+
+        fetcher = WeatherFetcher(transport=ReplayTransport(self.fixture_path, error_rate=1.0))
+        coords = {"latitude": 51.5085, "longitude": -0.1257, "name": "London"}
+        with self.assertRaises(ValueError):
+            fetcher.fetch_weather_at(coords)
+        self.assertEqual(fetcher.transport.errors, 1)
+
+    def test_replay_is_reproducible(self):
+        """Test that the same seed gives the same error pattern"""
+        def error_pattern():
+            transport = ReplayTransport(self.fixture_path, error_rate=0.5, seed=3)
+            url = next(iter(transport.responses))
+            pattern = []
+            for _ in range(20):
+                try:
+                    transport.get_text(url)
+                    pattern.append(True)
+                except urllib.error.URLError:
+                    pattern.append(False)
+            return pattern
+
+        self.assertEqual(error_pattern(), error_pattern())
+
+    def test_unrecorded_url(self):
+        """Test that unknown URLs fail instead of reaching the network"""
+        transport = ReplayTransport({})
+        with self.assertRaises(urllib.error.URLError):
+            transport.get_text("https://api.open-meteo.com/v1/forecast?latitude=0")
+
+    def test_invalid_configuration(self):
+        """Test validation of replay options"""
+        with self.assertRaises(ValueError):
+            ReplayTransport({}, error_rate=2)
+        with self.assertRaises(ValueError):
+            ReplayTransport({}, latency=-1)
+
+
+if __name__ == '__main__':
+    print("Running Weather Transport Tests...")
+    unittest.main(verbosity=2)
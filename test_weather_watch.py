@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Tests for the Weather Watch mode
+"""
+
+import contextlib
+import io
+import json
+import random
+import unittest
+from unittest.mock import MagicMock, patch
+from weather_fetcher import WeatherFetcher
+from weather_transport import Transport
+from weather_watch import WeatherWatcher, parse_location_spec, main
+
+
+class FakeClock:
+    """Manually advanced clock whose sleep just moves time forward"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def sample_result(name, temp_c):
+    """Build a get_temperature_in_all_formats() style result"""
+    return {
+        "location": {"name": name, "country": "Test", "latitude": 1.0, "longitude": 2.0},
+        "temperatures": {
+            "celsius": temp_c,
+            "fahrenheit": temp_c * 9 / 5 + 32,
+            "kelvin": temp_c + 273.15
+        },
+        "additional_info": {"humidity": 50, "wind_speed": 5.0, "time": "2025-05-28T12:00"}
+    }
+
+
+class FakeNetwork(Transport):
+    """Knows only London; every other place name geocodes to no results"""
+
+    def get_text(self, url, timeout=10):
+        if "geocoding-api" in url:
+            if "name=London" not in url:
+                return json.dumps({"results": []})
+            return json.dumps({"results": [{"latitude": 51.5, "longitude": -0.13, "name": "London",
+                                            "country": "United Kingdom", "admin1": "England"}]})
+        return json.dumps({"current": {"time": "2025-05-28T12:00", "temperature_2m": 18.5,
+                                       "relative_humidity_2m": 70, "wind_speed_10m": 12.0}})
+
+
+class TestWeatherWatcher(unittest.TestCase):
+    """Test cases for WeatherWatcher"""
+
+    def setUp(self):
+        """Set up a watcher with a fake clock and mocked fetcher"""
+        self.clock = FakeClock()
+        self.output = io.StringIO()
+        self.fetcher = MagicMock()
+        self.fetcher.geocode.side_effect = lambda location: {"name": location}
+        self.fetcher.get_temperature_at.side_effect = (
+            lambda coords: sample_result(coords["name"], 20.0)
+        )
+
+    def make_watcher(self, locations, **kwargs):
+        return WeatherWatcher(
+            locations, fetcher=self.fetcher, output=self.output,
+            clock=self.clock, sleep=self.clock.sleep, rng=random.Random(0), **kwargs
+        )
+
+    def records(self):
+        return [json.loads(line) for line in self.output.getvalue().splitlines()]
+
+    def test_emits_ndjson_in_all_units(self):
+        """Test that each fetch produces one NDJSON line with C/F/K"""
+        watcher = self.make_watcher([("London", 60)])
+        watcher.run(max_fetches=1)
+
+        records = self.records()
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0]["query"], "London")
+        self.assertEqual(records[0]["celsius"], 20.0)
+        self.assertAlmostEqual(records[0]["fahrenheit"], 68.0)
+        self.assertAlmostEqual(records[0]["kelvin"], 293.15)
+
+    def test_per_location_intervals(self):
+        """Test that locations are polled at their own rates"""
+        watcher = self.make_watcher([("Fast", 10), ("Slow", 100)], jitter=0)
+        watcher.run(duration=300)
+
+        queries = [record["query"] for record in self.records()]
+        self.assertEqual(queries.count("Fast"), 30)
+        self.assertEqual(queries.count("Slow"), 3)
+
+    def test_initial_fetches_are_staggered(self):
+        """Test that locations with the same interval don't fire together"""
+        watcher = self.make_watcher([(f"City{i}", 60) for i in range(4)], jitter=0)
+        fetch_times = []
+        self.fetcher.get_temperature_at.side_effect = (
+            lambda coords: fetch_times.append(self.clock.now) or sample_result(coords["name"], 1.0)
+        )
+        watcher.run(max_fetches=4)
+
+        self.assertEqual(fetch_times, [0.0, 15.0, 30.0, 45.0])
+
+    def test_failures_are_reported_and_retried(self):
+        """Test that a failing location emits an error and others keep working"""
+        def fetch(coords):
+            if coords["name"] == "Broken":
+                raise ValueError("Error fetching weather data: timeout")
+            return sample_result(coords["name"], 10.0)
+
+        self.fetcher.get_temperature_at.side_effect = fetch
+        watcher = self.make_watcher([("Broken", 600), ("Good", 600)], jitter=0, retry_delay=10)
+        watcher.run(duration=100)
+
+        records = self.records()
+        errors = [r for r in records if "error" in r]
+        self.assertTrue(all(r["query"] == "Broken" for r in errors))
+        self.assertIn("timeout", errors[0]["error"])
+        # Retries back off: 0, 10, 30, 70
+        self.assertEqual(len(errors), 4)
+        self.assertEqual(watcher.errors, 4)
+
+    def test_locations_are_geocoded_once(self):
+        """Test that repeated polls reuse the resolved coordinates"""
+        watcher = self.make_watcher([("London", 60)])
+        watcher.run(max_fetches=3)
+        self.assertEqual(self.fetcher.geocode.call_count, 1)
+        self.assertEqual(self.fetcher.get_temperature_at.call_count, 3)
+
+    def test_unknown_location_is_an_error(self):
+        """Test that an unknown name fails instead of falling back to a default"""
+        self.fetcher.geocode.side_effect = lambda location: None
+        watcher = self.make_watcher([("Atlantis", 60)])
+        watcher.run(max_fetches=2)
+
+        records = self.records()
+        self.assertEqual([r["error"] for r in records], ["Location not found: Atlantis"] * 2)
+        self.fetcher.get_temperature_at.assert_not_called()
+
+    def test_stdout_holds_only_ndjson(self):
+        """Test with a real fetcher that nothing but JSON lines reaches stdout"""
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            watcher = WeatherWatcher(
+                [("London", 60), ("Atlantis", 60)], fetcher=WeatherFetcher(transport=FakeNetwork()),
+                clock=self.clock, sleep=self.clock.sleep, rng=random.Random(0)
+            )
+            watcher.run(max_fetches=4)
+
+        records = [json.loads(line) for line in stdout.getvalue().splitlines()]
+        self.assertEqual(len(records), 4)
+        self.assertEqual({r["query"] for r in records if "error" in r}, {"Atlantis"})
+        self.assertEqual({r["name"] for r in records if "error" not in r}, {"London"})
+
+    def test_backoff_is_capped_for_long_outages(self):
+        """Test that days of consecutive failures neither overflow nor exceed the interval"""
+        watcher = self.make_watcher([("Broken", 60)], retry_delay=15.0)
+        watcher._failures[0] = 5000
+        self.assertEqual(watcher._next_due(0, due=0.0, now=100.0), 160.0)
+
+    def test_invalid_configuration(self):
+        """Test validation of locations and intervals"""
+        with self.assertRaises(ValueError):
+            self.make_watcher([])
+        for interval in (0, -60, 1e-9, float('nan'), float('inf')):
+            with self.subTest(interval=interval), self.assertRaises(ValueError):
+                self.make_watcher([("London", interval)])
+        for retry_delay in (0, -1, float('nan'), float('inf')):
+            with self.subTest(retry_delay=retry_delay), self.assertRaises(ValueError):
+                self.make_watcher([("London", 60)], retry_delay=retry_delay)
+
+    def test_parse_location_spec(self):
+        """Test parsing location arguments"""
+        self.assertEqual(parse_location_spec("London=60"), ("London", 60.0))
+        self.assertEqual(parse_location_spec("New York", 120), ("New York", 120))
+        with self.assertRaises(ValueError):
+            parse_location_spec("London=soon")
+
+    def test_cli_rejects_unusable_intervals(self):
+        """Test that "London=nan" style arguments are usage errors"""
+        for spec in ("London=nan", "London=inf", "London=1e-9"):
+            with self.subTest(spec=spec), patch("sys.stderr", io.StringIO()) as stderr:
+                with self.assertRaises(SystemExit):
+                    main([spec])
+                self.assertIn("Interval for London", stderr.getvalue())
+
+
+if __name__ == '__main__':
+    print("Running Weather Watch Tests...")
+    unittest.main(verbosity=2)
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Weather Batch Mode
+Reads location names or "lat,lon" pairs from a file or stdin, fetches them
+concurrently, and streams results as CSV or NDJSON in all three units as
+they finish. A summary goes to stderr.
+
+Repeated names are fetched once: later lines reuse the first result, and
+geocoding results are cached across the whole run.
+"""
+
+import argparse
+import csv
+import json
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from spatial_cache import ReadingIndex
+from weather_fetcher import WeatherFetcher, reading_record
+
+
+COLUMNS = [
+    "line", "query", "name", "admin1", "country", "latitude", "longitude", "time",
+    "celsius", "fahrenheit", "kelvin", "humidity", "wind_speed", "cached", "error",
+]
+
+_COORDINATES = re.compile(r"^\s*(-?\d+(?:\.\d+)?)\s*[,\s]\s*(-?\d+(?:\.\d+)?)\s*$")
+
+
+def parse_query(text):
+    """
+    Parse one input line
+
+    Args:
+        text (str): A location name or a "lat,lon" pair
+
+    Returns:
+        tuple: (dedup key, location name or (lat, lon)), or None for blank
+               lines and # comments
+    """
+    text = text.strip()
+    if not text or text.startswith("#"):
+        return None
+
+    match = _COORDINATES.match(text)
+    if match:
+        latitude, longitude = float(match.group(1)), float(match.group(2))
+        if not (-90 <= latitude <= 90 and -180 <= longitude <= 180):
+            raise ValueError(f"Coordinates out of range: {text}")
+        return ("coords", round(latitude, 5), round(longitude, 5)), (latitude, longitude)
+
+    # Collapse case and whitespace so "new  york" and "New York" share a fetch
+    return ("name", " ".join(text.casefold().split())), text
+
+
+class BatchRunner:
+    """Fetches a stream of queries concurrently and writes rows as they finish"""
+
+    def __init__(self, fetcher, writer, workers=8, max_pending=None):
+        """
+        Args:
+            fetcher (WeatherFetcher): Shared fetcher (its caches are thread-safe)
+            writer (callable): Called with one row dict per input line
+            workers (int): Concurrent fetches
+            max_pending (int, optional): Unfinished fetches allowed before input
+                                         reading pauses, defaults to 4 * workers
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self.fetcher = fetcher
+        self.writer = writer
+        self.workers = workers
+        self.max_pending = max_pending or workers * 4
+
+        self.lines = 0
+        self.fetched = 0
+        self.cache_hits = 0
+        self.failures = 0
+        self.elapsed = 0.0
+
+    def _fetch(self, target):
+        """Fetch one unique query (runs on a worker thread)"""
+        if isinstance(target, tuple):
+            data = self.fetcher.get_temperature_near(*target)
+            return reading_record(data), data["cache"]["hit"]
+
+        coords = self.fetcher.geocode(target)
+        if not coords:
+            raise ValueError(f"Location not found: {target}")
+        return reading_record(self.fetcher.get_temperature_at(coords)), False
+
+    def _emit(self, line, query, outcome, cached):
+        """Write one output row from a (record, error) outcome"""
+        record, error = outcome
+        row = {"line": line, "query": query, **(record or {}), "cached": cached, "error": error}
+        if error:
+            self.failures += 1
+        elif cached:
+            self.cache_hits += 1
+        self.writer(row)
+
+    def run(self, lines):
+        """
+        Process input lines until exhausted
+
+        Args:
+            lines (iterable): Input lines (file object, list, stdin, ...)
+        """
+        start = time.perf_counter()
+        try:
+            self._run(lines)
+        finally:
+            self.elapsed = time.perf_counter() - start
+
+    def _run(self, lines):
+        """Read lines, submitting new queries and reusing finished ones"""
+        results = {}   # key -> (record, error), for deduplicating later lines
+        pending = {}   # future -> key
+        waiting = {}   # key -> [(line number, query text)]
+
+        def collect(done):
+            for future in done:
+                key = pending.pop(future)
+                try:
+                    record, index_hit = future.result()
+                    outcome = (record, None)
+                except Exception as e:
+                    outcome, index_hit = (None, str(e)), False
+                results[key] = outcome
+                if not index_hit:
+                    # Readings served from the ReadingIndex never reached the API
+                    self.fetched += 1
+                first, *rest = waiting.pop(key)
+                self._emit(*first, outcome, index_hit)
+                for line, query in rest:
+                    self._emit(line, query, outcome, True)
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            for line_number, text in enumerate(lines, 1):
+                try:
+                    parsed = parse_query(text)
+                except ValueError as e:
+                    self.lines += 1
+                    self._emit(line_number, text.strip(), (None, str(e)), False)
+                    continue
+                if parsed is None:
+                    continue
+
+                self.lines += 1
+                key, target = parsed
+                query = text.strip()
+                if key in results:
+                    self._emit(line_number, query, results[key], True)
+                elif key in waiting:
+                    waiting[key].append((line_number, query))
+                else:
+                    waiting[key] = [(line_number, query)]
+                    pending[pool.submit(self._fetch, target)] = key
+                    if len(pending) >= self.max_pending:
+                        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        collect(done)
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
+
+    def summary(self):
+        """One-line run summary"""
+        rate = self.lines / self.elapsed if self.elapsed else 0.0
+        return (f"Processed {self.lines} lines in {self.elapsed:.2f}s ({rate:.1f} lines/s): "
+                f"{self.fetched} fetched, {self.cache_hits} cache hits, {self.failures} failures")
+
+
+def make_writer(output, fmt):
+    """Build a row writer for "csv" or "ndjson" that flushes every row"""
+    if fmt == "csv":
+        writer = csv.DictWriter(output, fieldnames=COLUMNS, extrasaction="ignore")
+        writer.writeheader()
+
+        def write(row):
+            writer.writerow(row)
+            output.flush()
+    else:
+        def write(row):
+            output.write(json.dumps(row) + "\n")
+            output.flush()
+    return write
+
+
+def main(argv=None):
+    """Command-line entry point for batch mode"""
+    parser = argparse.ArgumentParser(
+        description="Fetch current temperature for many locations and stream CSV or NDJSON."
+    )
+    parser.add_argument("input", nargs="?", default="-", type=argparse.FileType("r", encoding="utf-8"),
+                        help='File with one location name or "lat,lon" per line (default: stdin)')
+    parser.add_argument("--format", choices=["csv", "ndjson"], default="csv",
+                        help="Output format (default: %(default)s)")
+    parser.add_argument("--workers", type=int, default=8,
+                        help="Concurrent fetches (default: %(default)s)")
+    parser.add_argument("--radius", type=float,
+                        help="Serve lat/lon queries from cached readings within this many km")
+    args = parser.parse_args(argv)
+
+    try:
+        reading_index = ReadingIndex(radius_km=args.radius) if args.radius is not None else None
+        fetcher = WeatherFetcher(reading_index=reading_index)
+        runner = BatchRunner(fetcher, make_writer(sys.stdout, args.format), workers=args.workers)
+    except ValueError as e:
+        parser.error(str(e))
+
+    # FileType has already opened the input, reporting a missing file as a usage error
+    try:
+        runner.run(args.input)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if args.input is not sys.stdin:
+            args.input.close()
+    print(runner.summary(), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
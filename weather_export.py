@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Weather Export
+Accumulates readings into fixed-size batches and writes them as Parquet or
+Arrow IPC files (with pyarrow installed) or CSV (standard library only).
+
+Only Celsius is buffered per reading; the Fahrenheit and Kelvin columns are
+produced with one buffer conversion per batch when the batch is written.
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+from array import array
+from temp_converter import TempConverter
+from weather_fetcher import reading_record
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:  # Optional: only needed for Parquet/Arrow output
+    pyarrow = None
+
+
+TEXT_COLUMNS = ("name", "admin1", "country", "time")
+FLOAT_COLUMNS = ("latitude", "longitude", "humidity", "wind_speed")
+COLUMNS = TEXT_COLUMNS + FLOAT_COLUMNS + ("celsius", "fahrenheit", "kelvin")
+
+FORMATS_BY_EXTENSION = {
+    ".parquet": "parquet",
+    ".arrow": "ipc",
+    ".feather": "ipc",
+    ".ipc": "ipc",
+    ".csv": "csv",
+}
+
+
+class ReadingExporter:
+    """Buffers readings and writes them out one batch at a time"""
+
+    def __init__(self, path, format=None, batch_size=4096):
+        """
+        Args:
+            path (str): Output file
+            format (str, optional): "parquet", "ipc" or "csv"; inferred from
+                                    the file extension when omitted
+            batch_size (int): Readings buffered before a batch is written
+
+        Raises:
+            ValueError: If the format is unknown or batch_size is invalid
+            ImportError: If Parquet/Arrow output is requested without pyarrow
+        """
+        if format is None:
+            format = FORMATS_BY_EXTENSION.get(os.path.splitext(path)[1].lower())
+            if format is None:
+                raise ValueError(f"Can't infer export format from '{path}', "
+                                 f"expected one of: {sorted(FORMATS_BY_EXTENSION)}")
+        if format not in ("parquet", "ipc", "csv"):
+            raise ValueError(f"Unknown export format: {format}")
+        if format != "csv" and pyarrow is None:
+            raise ImportError("pyarrow is required for Parquet/Arrow export "
+                              "(pip install pyarrow), or export to .csv instead")
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+
+        self.path = path
+        self.format = format
+        self.batch_size = batch_size
+        self.rows_written = 0
+        self.batches_written = 0
+
+        self._columns = {name: [] for name in TEXT_COLUMNS + FLOAT_COLUMNS}
+        self._celsius = array('d')
+        self._writer = None
+        self._file = None
+
+    def add(self, data):
+        """Add a get_temperature_in_all_formats() result"""
+        self.add_record(reading_record(data))
+
+    def add_record(self, record):
+        """
+        Add a flat reading (as produced by reading_record(), or one NDJSON
+        line from watch/batch mode)
+
+        Raises:
+            ValueError: If the record has no Celsius temperature or it is below
+                        absolute zero
+        """
+        celsius = record.get("celsius")
+        if celsius is None:
+            raise ValueError("Reading has no Celsius temperature")
+        # Reject impossible readings before buffering them, so one bad reading
+        # can't fail every flush of its batch and leave the buffer growing
+        TempConverter.convert(celsius, 'C', 'C')
+        self._celsius.append(celsius)
+        for name, values in self._columns.items():
+            values.append(record.get(name))
+        if len(self._celsius) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """Write any buffered readings as one batch"""
+        if not self._celsius:
+            return
+
+        celsius = self._celsius
+        fahrenheit = array('d', bytes(len(celsius) * celsius.itemsize))
+        kelvin = array('d', bytes(len(celsius) * celsius.itemsize))
+        TempConverter.convert_buffer(celsius, 'C', 'F', out=fahrenheit)
+        TempConverter.convert_buffer(celsius, 'C', 'K', out=kelvin)
+
+        columns = dict(self._columns)
+        columns.update(celsius=celsius, fahrenheit=fahrenheit, kelvin=kelvin)
+        if self.format == "csv":
+            self._write_csv(columns)
+        else:
+            self._write_arrow(columns)
+
+        self.rows_written += len(celsius)
+        self.batches_written += 1
+        self._columns = {name: [] for name in self._columns}
+        self._celsius = array('d')
+
+    def _write_csv(self, columns):
+        if self._writer is None:
+            self._file = open(self.path, "w", newline="", encoding="utf-8")
+            self._writer = csv.writer(self._file)
+            self._writer.writerow(COLUMNS)
+        self._writer.writerows(zip(*(columns[name] for name in COLUMNS)))
+
+    def _write_arrow(self, columns):
+        arrays = [pyarrow.array(columns[name], type=pyarrow.string()) for name in TEXT_COLUMNS]
+        arrays += [pyarrow.array(columns[name], type=pyarrow.float64()) for name in FLOAT_COLUMNS]
+        # Wrap the converted arrays' memory directly instead of copying values
+        arrays += [
+            pyarrow.Array.from_buffers(pyarrow.float64(), len(columns[name]),
+                                       [None, pyarrow.py_buffer(columns[name])])
+            for name in ("celsius", "fahrenheit", "kelvin")
+        ]
+        batch = pyarrow.RecordBatch.from_arrays(arrays, names=list(COLUMNS))
+
+        if self._writer is None:
+            if self.format == "parquet":
+                self._writer = pyarrow.parquet.ParquetWriter(self.path, batch.schema)
+            else:
+                self._writer = pyarrow.ipc.new_file(self.path, batch.schema)
+        if self.format == "parquet":
+            self._writer.write_table(pyarrow.Table.from_batches([batch]))
+        else:
+            self._writer.write_batch(batch)
+
+    def close(self):
+        """Flush remaining readings and close the file, even if the flush fails"""
+        try:
+            self.flush()
+        finally:
+            if self._writer is None:
+                # Nothing was written; still leave a valid, empty CSV behind
+                if self.format == "csv":
+                    with open(self.path, "w", newline="", encoding="utf-8") as f:
+                        csv.writer(f).writerow(COLUMNS)
+            else:
+                if self.format == "csv":
+                    self._file.close()
+                else:
+                    self._writer.close()
+                self._writer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def main(argv=None):
+    """Convert NDJSON readings (from watch or batch mode) on stdin into a file"""
+    parser = argparse.ArgumentParser(
+        description="Write NDJSON weather readings from stdin to Parquet, Arrow IPC or CSV."
+    )
+    parser.add_argument("output", help="Output file (.parquet, .arrow, .feather or .csv)")
+    parser.add_argument("--format", choices=["parquet", "ipc", "csv"],
+                        help="Output format (default: from the file extension)")
+    parser.add_argument("--batch-size", type=int, default=4096,
+                        help="Readings per written batch (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    try:
+        exporter = ReadingExporter(args.output, format=args.format, batch_size=args.batch_size)
+    except (ValueError, ImportError) as e:
+        parser.error(str(e))
+
+    skipped = 0
+    with exporter:
+        for line in sys.stdin:
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:   # Malformed line, e.g. truncated output
+                skipped += 1
+                continue
+            if not isinstance(record, dict) or record.get("error") or record.get("celsius") is None:
+                skipped += 1
+                continue
+            try:
+                exporter.add_record(record)
+            except ValueError:
+                skipped += 1
+    print(f"Wrote {exporter.rows_written} readings in {exporter.batches_written} batches "
+          f"to {args.output} ({skipped} skipped)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,18 +4,97 @@ Weather Fetcher for Temperature Converter POC
 Fetches local temperature and converts to all three formats.
 """
 
-import json
-import urllib.request
 import urllib.parse
+from striped_cache import StripedCache
 from temp_converter import TempConverter
+from weather_transport import UrlopenTransport
+
+
+# Caller-facing field names and the Open-Meteo "current" variables behind them
+CURRENT_FIELDS = {
+    "temperature": "temperature_2m",
+    "humidity": "relative_humidity_2m",
+    "wind_speed": "wind_speed_10m",
+    "weather_code": "weather_code",
+}
+DEFAULT_FIELDS = ("temperature", "humidity", "wind_speed")
+
+# Temperature units and their key in the "temperatures" result
+UNIT_NAMES = {'C': "celsius", 'F': "fahrenheit", 'K': "kelvin"}
+UNIT_SYMBOLS = {'C': "°C", 'F': "°F", 'K': "K"}
 
 
 class WeatherFetcher:
     """Fetches weather data and converts temperatures"""
     
-    def __init__(self):
+    def __init__(self, transport=None, fields=DEFAULT_FIELDS, units=('C', 'F', 'K'),
+                 reading_index=None):
+        """
+        Args:
+            transport (Transport, optional): HTTP transport, defaults to live urllib
+                                             (see weather_transport for record/replay)
+            fields (iterable): Weather variables to request, from CURRENT_FIELDS;
+                               "temperature" is always required
+            units (iterable): Temperature units to report ('C', 'F', 'K')
+            reading_index (ReadingIndex, optional): Spatial cache consulted by
+                                                    get_temperature_near()
+        """
+        fields = tuple(dict.fromkeys(fields))
+        unknown = [field for field in fields if field not in CURRENT_FIELDS]
+        if unknown:
+            raise ValueError(f"Unknown fields {unknown}, expected some of: {list(CURRENT_FIELDS)}")
+        if "temperature" not in fields:
+            raise ValueError("fields must include 'temperature'")
+        units = tuple(dict.fromkeys(unit.upper() for unit in units))
+        if not units or any(unit not in UNIT_NAMES for unit in units):
+            raise ValueError(f"units must be a non-empty selection of: {list(UNIT_NAMES)}")
+        
+        self.fields = fields
+        self.units = units
+        self._current_param = ",".join(CURRENT_FIELDS[field] for field in fields)
         self.converter = TempConverter()
+        self.transport = transport or UrlopenTransport()
         self.base_url = "https://api.open-meteo.com/v1"
+        self.reading_index = reading_index
+        # Shared by every thread using this fetcher
+        self._coordinates_cache = StripedCache()
+    
+    def geocode(self, location):
+        """
+        Look up coordinates for a place name, without any fallback
+        
+        Args:
+            location (str): Location name (e.g., "New York", "London")
+        
+        Returns:
+            dict: Location info, or None if the name wasn't found
+        
+        Raises:
+            Exception: Whatever the transport raises on network errors
+        """
+        # Place names don't move, so reuse earlier geocoding results
+        cached = self._coordinates_cache.get(location)
+        if cached:
+            return dict(cached)
+        
+        geocoding_url = "https://geocoding-api.open-meteo.com/v1/search"
+        params = {"name": location, "count": 1, "language": "en", "format": "json"}
+        url = f"{geocoding_url}?{urllib.parse.urlencode(params)}"
+        
+        data = self.transport.get_json(url, timeout=10)
+        if not data.get("results"):
+            return None
+        
+        result = data["results"][0]
+        coords = {
+            "latitude": result["latitude"],
+            "longitude": result["longitude"],
+            "name": result["name"],
+            "country": result.get("country", ""),
+            "admin1": result.get("admin1", "")
+        }
+        self._coordinates_cache.set(location, coords)
+        return dict(coords)
     
     def get_location_coordinates(self, location=None):
         """
@@ -24,22 +103,10 @@ class WeatherFetcher:
         """
         if location:
             # Use geocoding API to get coordinates for specified location
-            geocoding_url = "https://geocoding-api.open-meteo.com/v1/search"
-            params = {"name": location, "count": 1, "language": "en", "format": "json"}
-            url = f"{geocoding_url}?{urllib.parse.urlencode(params)}"
-            
             try:
-                with urllib.request.urlopen(url, timeout=10) as response:
-                    data = json.loads(response.read().decode())
-                    if data.get("results"):
-                        result = data["results"][0]
-                        return {
-                            "latitude": result["latitude"],
-                            "longitude": result["longitude"],
-                            "name": result["name"],
-                            "country": result.get("country", ""),
-                            "admin1": result.get("admin1", "")
-                        }
+                coords = self.geocode(location)
+                if coords:
+                    return coords
             except Exception as e:
                 print(f"Error getting coordinates for {location}: {e}")
                 return None
@@ -47,16 +114,15 @@ class WeatherFetcher:
         # If no location specified, try IP-based detection
         try:
             # Simple IP geolocation (basic, but works for demo)
-            with urllib.request.urlopen("http://ip-api.com/json/?fields=lat,lon,city,regionName,country", timeout=10) as response:
-                data = json.loads(response.read().decode())
-                if data.get("lat") and data.get("lon"):
-                    return {
-                        "latitude": data["lat"],
-                        "longitude": data["lon"],
-                        "name": data.get("city", "Unknown"),
-                        "country": data.get("country", ""),
-                        "admin1": data.get("regionName", "")
-                    }
+            data = self.transport.get_json("http://ip-api.com/json/?fields=lat,lon,city,regionName,country", timeout=10)
+            if data.get("lat") and data.get("lon"):
+                return {
+                    "latitude": data["lat"],
+                    "longitude": data["lon"],
+                    "name": data.get("city", "Unknown"),
+                    "country": data.get("country", ""),
+                    "admin1": data.get("regionName", "")
+                }
         except Exception as e:
             print(f"Error detecting location: {e}")
             
@@ -86,35 +152,50 @@ class WeatherFetcher:
         if not coords:
             raise ValueError(f"Could not find coordinates for location: {location}")
         
-        # Fetch current weather
+        return self.fetch_weather_at(coords)
+    
+    def fetch_weather_at(self, coords):
+        """
+        Fetch current weather for already-resolved coordinates
+        
+        Args:
+            coords (dict): Location info with at least "latitude" and "longitude"
+        
+        Returns:
+            dict: Weather data with temperature and location info
+        """
         params = {
             "latitude": coords["latitude"],
             "longitude": coords["longitude"],
-            "current": "temperature_2m,relative_humidity_2m,wind_speed_10m,weather_code",
+            "current": self._current_param,
             "timezone": "auto"
         }
         
         url = f"{self.base_url}/forecast?{urllib.parse.urlencode(params)}"
         
         try:
-            with urllib.request.urlopen(url, timeout=10) as response:
-                data = json.loads(response.read().decode())
-                
-                current = data.get("current", {})
-                temperature_c = current.get("temperature_2m")
-                
-                if temperature_c is None:
-                    raise ValueError("Temperature data not available")
-                
-                return {
-                    "location": coords,
-                    "temperature_celsius": temperature_c,
-                    "humidity": current.get("relative_humidity_2m"),
-                    "wind_speed": current.get("wind_speed_10m"),
-                    "time": current.get("time"),
-                    "timezone": data.get("timezone")
-                }
-                
+            data = self.transport.get_json(url, timeout=10)
+            
+            current = data.get("current", {})
+            temperature_c = current.get("temperature_2m")
+            
+            if temperature_c is None:
+                raise ValueError("Temperature data not available")
+            
+            weather = {
+                "location": coords,
+                "temperature_celsius": temperature_c,
+                "humidity": None,
+                "wind_speed": None,
+                "time": current.get("time"),
+                "timezone": data.get("timezone")
+            }
+            # Only pick out the variables this fetcher asked for
+            for field in self.fields:
+                if field != "temperature":
+                    weather[field] = current.get(CURRENT_FIELDS[field])
+            return weather
+            
         except Exception as e:
             raise ValueError(f"Error fetching weather data: {e}")
     
@@ -122,36 +203,91 @@ class WeatherFetcher:
         """
         Get current temperature in Celsius, Fahrenheit, and Kelvin
         
+        Only the units this fetcher was created with are included.
+        
         Args:
             location (str, optional): Location name
             
         Returns:
-            dict: Temperature in all three formats with location info
+            dict: "temperatures" keyed by unit name ("celsius", "fahrenheit",
+                  "kelvin") for this fetcher's units only, plus location info
         """
         weather_data = self.fetch_current_temperature(location)
+        return self._with_all_formats(weather_data)
+    
+    def get_temperature_at(self, coords):
+        """
+        Get current temperature in this fetcher's units for resolved coordinates
+        
+        Args:
+            coords (dict): Location info with at least "latitude" and "longitude"
+            
+        Returns:
+            dict: Same shape as get_temperature_in_all_formats()
+        """
+        return self._with_all_formats(self.fetch_weather_at(coords))
+    
+    def get_temperature_near(self, latitude, longitude):
+        """
+        Get current temperature for raw coordinates, reusing a nearby reading
+        
+        With a reading_index, a fresh reading within its radius is returned
+        without calling the API; misses are fetched and added to the index.
+        
+        Args:
+            latitude (float): Latitude in degrees
+            longitude (float): Longitude in degrees
+            
+        Returns:
+            dict: Same shape as get_temperature_in_all_formats(), plus a
+                  "cache" entry with hit, distance_km and age_seconds
+        """
+        if self.reading_index is not None:
+            found = self.reading_index.nearest(latitude, longitude)
+            if found:
+                reading, distance, age = found
+                return {**reading, "cache": {"hit": True, "distance_km": distance, "age_seconds": age}}
+        
+        coords = {
+            "latitude": latitude,
+            "longitude": longitude,
+            "name": f"{latitude:.4f}, {longitude:.4f}",
+            "country": "",
+            "admin1": ""
+        }
+        reading = self.get_temperature_at(coords)
+        if self.reading_index is not None:
+            self.reading_index.insert(latitude, longitude, reading)
+        return {**reading, "cache": {"hit": False, "distance_km": 0.0, "age_seconds": 0.0}}
+    
+    def _with_all_formats(self, weather_data):
+        """Build the all-formats result from fetch_current_temperature() data"""
         temp_c = weather_data["temperature_celsius"]
         
-        # Convert to other formats
-        temp_f = self.converter.convert(temp_c, 'C', 'F')
-        temp_k = self.converter.convert(temp_c, 'C', 'K')
+        # Convert to the requested formats
+        temperatures = {
+            UNIT_NAMES[unit]: self.converter.convert(temp_c, 'C', unit)
+            for unit in self.units
+        }
+        
+        additional_info = {
+            "humidity": weather_data.get("humidity"),
+            "wind_speed": weather_data.get("wind_speed"),
+            "time": weather_data.get("time")
+        }
+        if "weather_code" in self.fields:
+            additional_info["weather_code"] = weather_data.get("weather_code")
         
         return {
             "location": weather_data["location"],
-            "temperatures": {
-                "celsius": temp_c,
-                "fahrenheit": temp_f,
-                "kelvin": temp_k
-            },
-            "additional_info": {
-                "humidity": weather_data.get("humidity"),
-                "wind_speed": weather_data.get("wind_speed"),
-                "time": weather_data.get("time")
-            }
+            "temperatures": temperatures,
+            "additional_info": additional_info
         }
     
     def display_weather_report(self, location=None):
         """
-        Display a nicely formatted weather report with temperatures in all formats
+        Display a nicely formatted weather report with temperatures in this
+        fetcher's units
         """
         try:
             data = self.get_temperature_in_all_formats(location)
@@ -174,11 +310,11 @@ class WeatherFetcher:
             print(f"🕐 Time: {info.get('time', 'Unknown')}")
             print()
             
-            # Temperature in all formats
+            # Temperature in whichever units were requested
             print("🌡️  Temperature:")
-            print(f"   • {temps['celsius']:.1f}°C (Celsius)")
-            print(f"   • {temps['fahrenheit']:.1f}°F (Fahrenheit)")
-            print(f"   • {temps['kelvin']:.1f}K (Kelvin)")
+            for unit, name in UNIT_NAMES.items():
+                if name in temps:
+                    print(f"   • {temps[name]:.1f}{UNIT_SYMBOLS[unit]} ({name.title()})")
             print()
             
             # Additional weather info
@@ -195,6 +331,30 @@ class WeatherFetcher:
             print("Please check your internet connection or try specifying a location.")
 
 
+def reading_record(data):
+    """
+    Flatten a get_temperature_in_all_formats() result into a single-level dict
+    
+    Suitable for one line of NDJSON or one CSV row.
+    """
+    loc = data["location"]
+    temps = data["temperatures"]
+    info = data["additional_info"]
+    return {
+        "name": loc.get("name"),
+        "admin1": loc.get("admin1"),
+        "country": loc.get("country"),
+        "latitude": loc.get("latitude"),
+        "longitude": loc.get("longitude"),
+        "time": info.get("time"),
+        "celsius": temps.get("celsius"),
+        "fahrenheit": temps.get("fahrenheit"),
+        "kelvin": temps.get("kelvin"),
+        "humidity": info.get("humidity"),
+        "wind_speed": info.get("wind_speed"),
+    }
+
+
 def main():
     """Interactive weather fetcher"""
     print("🌤️  Weather Temperature Fetcher")
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+HTTP transports for the Weather Fetcher
+The default transport talks to the network; the recording and replay
+transports capture responses into a fixture file and play them back offline
+with simulated latency, jitter and errors for reproducible benchmarks.
+"""
+
+import argparse
+import json
+import random
+import socket
+import threading
+import time
+import urllib.error
+import urllib.request
+
+
+FIXTURE_VERSION = 1
+
+
+class Transport:
+    """Base transport: subclasses implement get_text()"""
+
+    def get_text(self, url, timeout=10):
+        """Return the decoded response body for url"""
+        raise NotImplementedError
+
+    def get_json(self, url, timeout=10):
+        """Return the parsed JSON response body for url"""
+        return json.loads(self.get_text(url, timeout))
+
+
+class UrlopenTransport(Transport):
+    """Fetches over the network with urllib"""
+
+    def get_text(self, url, timeout=10):
+        with urllib.request.urlopen(url, timeout=timeout) as response:
+            return response.read().decode()
+
+
+class RecordingTransport(Transport):
+    """
+    Passes requests through to another transport and records every response
+
+    Use as a context manager to save the fixture file on exit.
+    """
+
+    def __init__(self, path, inner=None):
+        """
+        Args:
+            path (str): Fixture file to write
+            inner (Transport, optional): Transport to record, network by default
+        """
+        self.path = path
+        self.inner = inner or UrlopenTransport()
+        self.responses = {}
+        self._lock = threading.Lock()
+
+    def get_text(self, url, timeout=10):
+        body = self.inner.get_text(url, timeout)
+        with self._lock:
+            self.responses[url] = body
+        return body
+
+    def save(self):
+        """Write the recorded responses to the fixture file"""
+        with self._lock:
+            responses = dict(self.responses)
+        save_fixture(self.path, responses)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.save()
+
+
+class ReplayTransport(Transport):
+    """Serves recorded responses with optional simulated latency and errors"""
+
+    def __init__(self, fixture, latency=0.0, jitter=0.0, error_rate=0.0,
+                 seed=None, sleep=time.sleep):
+        """
+        Args:
+            fixture (str or dict): Fixture file path, or a {url: body} dict
+            latency (float): Mean simulated latency per request in seconds;
+                             a request whose delay exceeds its timeout fails
+                             with a timeout URLError after waiting the timeout
+            jitter (float): Latency varies uniformly within +/- jitter seconds
+            error_rate (float): Fraction of requests that fail with URLError
+            seed (int, optional): Seed for reproducible latency and errors
+            sleep (callable): Sleep function used to simulate latency
+        """
+        if not 0 <= error_rate <= 1:
+            raise ValueError("error_rate must be between 0 and 1")
+        if latency < 0 or jitter < 0:
+            raise ValueError("latency and jitter cannot be negative")
+
+        self.responses = load_fixture(fixture) if isinstance(fixture, str) else dict(fixture)
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rng = random.Random(seed)
+        self.sleep = sleep
+        self.requests = 0
+        self.errors = 0
+        self._lock = threading.Lock()
+
+    def get_text(self, url, timeout=10):
+        # Counters and random draws are shared between threads; sleep outside
+        # the lock so concurrent requests still overlap
+        with self._lock:
+            self.requests += 1
+            delay = 0.0
+            if self.latency or self.jitter:
+                delay = self.latency + self.rng.uniform(-self.jitter, self.jitter)
+            timed_out = timeout is not None and delay > timeout
+            failed = bool(self.error_rate) and self.rng.random() < self.error_rate
+            body = None if failed else self.responses.get(url)
+            if body is None or timed_out:
+                self.errors += 1
+
+        if delay > 0:
+            self.sleep(min(delay, timeout) if timeout is not None else delay)
+        if timed_out:
+            # Same shape as urlopen's error when a request exceeds its timeout
+            raise urllib.error.URLError(socket.timeout("timed out"))
+        if failed:
+            raise urllib.error.URLError("Simulated network error")
+        if body is None:
+            raise urllib.error.URLError(f"No recorded response for {url}")
+        return body
+
+
+def load_fixture(path):
+    """
+    Load recorded responses from a fixture file
+
+    Returns:
+        dict: {url: response body}
+    """
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    if data.get("version") != FIXTURE_VERSION:
+        raise ValueError(f"Unsupported fixture version: {data.get('version')}")
+    return data["responses"]
+
+
+def save_fixture(path, responses):
+    """Write {url: response body} to a fixture file"""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"version": FIXTURE_VERSION, "responses": responses}, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def main(argv=None):
+    """Record live responses for a list of locations into a fixture file"""
+    # Imported here to avoid a circular import at module load
+    from weather_fetcher import WeatherFetcher
+
+    parser = argparse.ArgumentParser(description="Record weather API responses for offline replay.")
+    parser.add_argument("fixture", help="Fixture file to write")
+    parser.add_argument("locations", nargs="+", help="Location names to fetch")
+    parser.add_argument("--fields", nargs="+", help="Weather fields to request (default: fetcher default)")
+    args = parser.parse_args(argv)
+
+    with RecordingTransport(args.fixture) as transport:
+        if args.fields:
+            fetcher = WeatherFetcher(transport=transport, fields=args.fields)
+        else:
+            fetcher = WeatherFetcher(transport=transport)
+        for location in args.locations:
+            try:
+                fetcher.fetch_current_temperature(location)
+                print(f"✅ Recorded {location}")
+            except ValueError as e:
+                print(f"❌ {location}: {e}")
+    print(f"Saved {len(transport.responses)} responses to {args.fixture}")
+
+
+if __name__ == "__main__":
+    main()
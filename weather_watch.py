@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Weather Watch Mode
+Polls several locations on their own intervals and emits readings as NDJSON.
+
+All locations share one loop driven by a heap of due times, so the process
+needs no threads and its memory stays proportional to the number of
+locations no matter how long it runs.
+"""
+
+import argparse
+import heapq
+import json
+import math
+import random
+import sys
+import time
+from datetime import datetime, timezone
+from weather_fetcher import WeatherFetcher, reading_record
+
+
+DEFAULT_INTERVAL = 300
+MIN_INTERVAL = 1   # Seconds; anything shorter just spins the loop against the API
+
+
+class WeatherWatcher:
+    """Schedules periodic weather fetches for several locations"""
+
+    def __init__(self, locations, fetcher=None, output=None, jitter=0.1,
+                 retry_delay=15, clock=time.monotonic, sleep=time.sleep, rng=None):
+        """
+        Args:
+            locations (list): (location name, interval seconds) pairs
+            fetcher (WeatherFetcher, optional): Fetcher to use, a new one by default
+            output (file, optional): Where NDJSON lines go, defaults to stdout
+            jitter (float): Random +/- fraction applied to each interval
+            retry_delay (float): First retry delay after a failure, doubled per
+                                 consecutive failure and capped at the interval;
+                                 must be positive
+            clock (callable): Monotonic time source
+            sleep (callable): Sleep function
+            rng (random.Random, optional): Random source for jitter
+        """
+        if not locations:
+            raise ValueError("At least one location is required")
+        for location, interval in locations:
+            # Written so NaN fails too; NaN or inf due times would never come up
+            if not (math.isfinite(interval) and interval >= MIN_INTERVAL):
+                raise ValueError(f"Interval for {location} must be a finite number of "
+                                 f"seconds, at least {MIN_INTERVAL}")
+        if not 0 <= jitter < 1:
+            raise ValueError("Jitter must be in [0, 1)")
+        if not (math.isfinite(retry_delay) and retry_delay > 0):
+            raise ValueError("retry_delay must be a positive number of seconds")
+
+        self.locations = list(locations)
+        self.fetcher = fetcher or WeatherFetcher()
+        self.output = output or sys.stdout
+        self.jitter = jitter
+        self.retry_delay = retry_delay
+        self.clock = clock
+        self.sleep = sleep
+        self.rng = rng or random.Random()
+
+        self._failures = [0] * len(self.locations)
+        self._coords = [None] * len(self.locations)   # Geocoded once per location
+        self._heap = []
+        self.fetches = 0
+        self.errors = 0
+
+    def _schedule_initial(self, start):
+        """Stagger first fetches evenly across each location's interval"""
+        count = len(self.locations)
+        self._heap = [
+            (start + interval * index / count, index)
+            for index, (_, interval) in enumerate(self.locations)
+        ]
+        heapq.heapify(self._heap)
+
+    def _next_due(self, index, due, now):
+        """Work out when a location should be fetched next"""
+        interval = self.locations[index][1]
+        failures = self._failures[index]
+        if failures:
+            # Cap the exponent so a location that stays down for days can't overflow
+            delay = min(interval, self.retry_delay * 2 ** min(failures - 1, 32))
+            return now + delay
+
+        delay = interval * (1 + self.rng.uniform(-self.jitter, self.jitter))
+        next_due = due + delay
+        # If we fell behind, don't try to catch up with a burst of requests
+        if next_due <= now:
+            next_due = now + delay
+        return next_due
+
+    def poll(self, index):
+        """
+        Fetch one location and write its NDJSON record
+
+        The name is geocoded on the first successful poll without any
+        fallback, so an unknown place is reported as an error rather than
+        replaced by a default location.
+
+        Returns:
+            dict: The record that was written
+        """
+        location = self.locations[index][0]
+        fetched_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        try:
+            coords = self._coords[index]
+            if coords is None:
+                coords = self.fetcher.geocode(location)
+                if not coords:
+                    raise ValueError(f"Location not found: {location}")
+                self._coords[index] = coords
+            data = self.fetcher.get_temperature_at(coords)
+            record = reading_record(data)
+            self._failures[index] = 0
+        except Exception as e:
+            record = {"error": str(e)}
+            self._failures[index] += 1
+            self.errors += 1
+
+        record = {"query": location, "fetched_at": fetched_at, **record}
+        self.output.write(json.dumps(record) + "\n")
+        self.output.flush()
+        self.fetches += 1
+        return record
+
+    def run(self, max_fetches=None, duration=None):
+        """
+        Poll until stopped
+
+        Args:
+            max_fetches (int, optional): Stop after this many fetches
+            duration (float, optional): Stop after this many seconds
+        """
+        start = self.clock()
+        self._schedule_initial(start)
+        deadline = start + duration if duration is not None else None
+
+        while max_fetches is None or self.fetches < max_fetches:
+            due, index = self._heap[0]
+            if deadline is not None and due >= deadline:
+                return
+
+            now = self.clock()
+            if due > now:
+                self.sleep(due - now)
+
+            self.poll(index)
+            heapq.heapreplace(self._heap, (self._next_due(index, due, self.clock()), index))
+
+
+def parse_location_spec(spec, default_interval=DEFAULT_INTERVAL):
+    """
+    Parse a "Location=seconds" argument
+
+    Args:
+        spec (str): e.g. "London=60" or just "London"
+        default_interval (float): Interval used when none is given
+
+    Returns:
+        tuple: (location, interval)
+    """
+    name, sep, interval = spec.rpartition("=")
+    if not sep:
+        return spec.strip(), default_interval
+    try:
+        return name.strip(), float(interval)
+    except ValueError:
+        raise ValueError(f"Invalid interval in '{spec}'")
+
+
+def main(argv=None):
+    """Command-line entry point for watch mode"""
+    parser = argparse.ArgumentParser(
+        description="Poll weather for several locations and print NDJSON readings."
+    )
+    parser.add_argument("locations", nargs="+",
+                        help='Locations to watch, optionally with an interval: "London=60"')
+    parser.add_argument("--interval", type=float, default=DEFAULT_INTERVAL,
+                        help="Default polling interval in seconds (default: %(default)s)")
+    parser.add_argument("--jitter", type=float, default=0.1,
+                        help="Random +/- fraction applied to intervals (default: %(default)s)")
+    parser.add_argument("--duration", type=float,
+                        help="Stop after this many seconds")
+    parser.add_argument("--max-fetches", type=int,
+                        help="Stop after this many fetches")
+    args = parser.parse_args(argv)
+
+    try:
+        locations = [parse_location_spec(spec, args.interval) for spec in args.locations]
+        watcher = WeatherWatcher(locations, jitter=args.jitter)
+    except ValueError as e:
+        parser.error(str(e))
+
+    try:
+        watcher.run(max_fetches=args.max_fetches, duration=args.duration)
+    except KeyboardInterrupt:
+        pass
+    print(f"Watched {len(locations)} locations: {watcher.fetches} fetches, "
+          f"{watcher.errors} errors", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()